@@ -24,7 +24,7 @@ def Configure(configurer: str = "lxd") -> LXDConfigurer:  # noqa N802
         (LXDConfigurer): Configurer for LXD test environment provider.
     """
     dispatch = {"lxd": LXDConfigurer}
-    if configurer not in dispatch.keys():
+    if configurer not in dispatch:
         raise UnknownConfigurerError(f"{configurer} is not a valid configurer option.")
 
     return dispatch[configurer]()
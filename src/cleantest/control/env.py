@@ -14,6 +14,7 @@ class Env(Resettable):
     """Manage environment data for test environments."""
 
     _env = {}
+    _dump = None
 
     def __new__(cls) -> "Env":
         """Create new Env object instance.
@@ -27,7 +28,8 @@ class Env(Resettable):
 
     def reset(self) -> None:
         """Reset environment information."""
-        self._env = {}
+        self._env.clear()
+        self._dump = None
 
     def add(self, env_mapping: Dict[str, Any]) -> None:
         """Add new values to environment.
@@ -37,6 +39,7 @@ class Env(Resettable):
                 Key, value mapping to add to the environment store.
         """
         self._env.update(env_mapping)
+        self._dump = None
 
     def remove(self, env_var: str) -> None:
         """Remove an environment variable from store.
@@ -46,8 +49,9 @@ class Env(Resettable):
         Args:
             env_var (str): Environment variable to Remove from the store.
         """
-        if env_var in self._env.keys():
+        if env_var in self._env:
             del self._env[env_var]
+            self._dump = None
 
     def get(self, env_var: str) -> Optional[Any]:
         """Retrieve environment variable from store.
@@ -59,11 +63,7 @@ class Env(Resettable):
             (Optional[Any]): Environment variable value.
                 Returns None if variable is not in store.
         """
-        try:
-            if type(self._env[env_var]) == list:
-                return os.pathsep.join(self._env[env_var])
-        except KeyError:
-            return None
+        return self._cached_dump().get(env_var)
 
     def dump(self) -> Dict[str, Any]:
         """Dump environment store as a dictionary.
@@ -71,11 +71,20 @@ class Env(Resettable):
         Returns:
             (Dict[str, Any]): Environment store as a dictionary.
         """
-        result = {}
-        for k, v in self._env.items():
-            if type(v) == list:
-                result.update({k: os.pathsep.join(v)})
-            else:
-                result.update({k: v})
-
-        return result
+        return dict(self._cached_dump())
+
+    def _cached_dump(self) -> Dict[str, Any]:
+        """Get the environment store as a dictionary without copying it.
+
+        The dump is cached until the store is next modified.
+
+        Returns:
+            (Dict[str, Any]): Cached environment store. Must not be modified.
+        """
+        if self._dump is None:
+            self._dump = {
+                k: os.pathsep.join(v) if isinstance(v, list) else v
+                for k, v in self._env.items()
+            }
+
+        return self._dump
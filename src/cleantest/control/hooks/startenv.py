@@ -4,7 +4,7 @@
 
 """Hook run when test environment first starts."""
 
-from typing import List
+from typing import List, Optional
 
 from cleantest.meta import Injectable
 
@@ -14,16 +14,18 @@ class StartEnvHook:
 
     Args:
         name (str): Unique name of hook.
-        packages (List[Injectable]): Packages to inject into test environment.
-        upload (List[Injectable]): Artifacts to upload into test environment.
+        packages (Optional[List[Injectable]]):
+            Packages to inject into test environment (Default: None).
+        upload (Optional[List[Injectable]]):
+            Artifacts to upload into test environment (Default: None).
     """
 
     def __init__(
         self,
         name: str = "default",
-        packages: List[Injectable] = [],
-        upload: List[Injectable] = [],
+        packages: Optional[List[Injectable]] = None,
+        upload: Optional[List[Injectable]] = None,
     ) -> None:
         self.name = name
-        self.packages = packages
-        self.upload = upload
+        self.packages = packages if packages is not None else []
+        self.upload = upload if upload is not None else []
@@ -4,7 +4,7 @@
 
 """Hook run before test environment stops."""
 
-from typing import List
+from typing import List, Optional
 
 from cleantest.meta import Injectable
 
@@ -14,9 +14,12 @@ class StopEnvHook:
 
     Args:
         name (str): Unique name of hook.
-        download (List[Injectable]): Artifacts to download from test environment.
+        download (Optional[List[Injectable]]):
+            Artifacts to download from test environment (Default: None).
     """
 
-    def __init__(self, name: str = "default", download: List[Injectable] = []) -> None:
+    def __init__(
+        self, name: str = "default", download: Optional[List[Injectable]] = None
+    ) -> None:
         self.name = name
-        self.download = download
+        self.download = download if download is not None else []
@@ -11,6 +11,15 @@ from cleantest.meta._base_configurer import BaseConfigurer, BaseConfigurerError
 
 from .lxd_config import ClientConfig, InstanceConfig, _DefaultSources
 
+# Default instance configurations. Built once; the registry only hands out copies.
+_DEFAULT_CONFIGS = {
+    config.name: config
+    for config in (
+        InstanceConfig(name=name.replace("_", "-").lower(), source=source)
+        for name, source in _DefaultSources.items()
+    )
+}
+
 
 class BadClientConfigurationError(BaseConfigurerError):
     """Raised if given client configuration is bad."""
@@ -27,10 +36,8 @@ class LXDInstanceConfigNotFoundError(BaseConfigurerError):
 class LXDConfigurer(BaseConfigurer):
     """Configurer for LXD test environment provider."""
 
-    __configs = {
-        InstanceConfig(name=name.replace("_", "-").lower(), source=source)
-        for name, source in _DefaultSources.items()
-    }
+    __configs = dict(_DEFAULT_CONFIGS)
+    __payloads = {}
     __client_config = ClientConfig()
 
     def __new__(cls) -> "LXDConfigurer":
@@ -74,10 +81,8 @@ class LXDConfigurer(BaseConfigurer):
 
     def reset(self) -> None:
         """Reset LXD test environment provider to default configuration."""
-        self.__configs = {
-            InstanceConfig(name=name.replace("_", "-").lower(), source=source)
-            for name, source in _DefaultSources.items()
-        }
+        self.__configs = dict(_DEFAULT_CONFIGS)
+        self.__payloads = {}
         self.__client_config = ClientConfig()
         super().reset()
 
@@ -93,8 +98,8 @@ class LXDConfigurer(BaseConfigurer):
                 Raised if two or more configs have the same name.
         """
         for config in new_config:
-            if config.name not in [c.name for c in self.__configs]:
-                self.__configs.add(config)
+            if config.name not in self.__configs:
+                self.__configs[config.name] = config
             else:
                 raise DuplicateLXDInstanceConfigError(
                     f"Instance configuration with name {config.name} already exists."
@@ -109,9 +114,8 @@ class LXDConfigurer(BaseConfigurer):
             name (str): Names of the instance configurations to delete.
         """
         for config_name in name:
-            for config in self.__configs:
-                if config_name == config.name:
-                    self.__configs.remove(config)
+            self.__configs.pop(config_name, None)
+            self.__payloads.pop(config_name, None)
 
     def get_instance_config(self, name: str) -> InstanceConfig:
         """Return an LXD instance configuration.
@@ -126,8 +130,31 @@ class LXDConfigurer(BaseConfigurer):
         Returns:
             (InstanceConfig): Retrieved LXD image configuration.
         """
-        for config in self.__configs:
-            if config.name == name:
-                return copy.deepcopy(config)
+        try:
+            return copy.deepcopy(self.__configs[name])
+        except KeyError:
+            raise LXDInstanceConfigNotFoundError(
+                f"Could not find instance {name}."
+            ) from None
+
+    def get_instance_payload(self, name: str, instance_name: str) -> Dict[str, Any]:
+        """Return the request payload for creating an instance from a configuration.
+
+        The configuration is serialized once and reused on later calls; each
+        call gets a shallow copy with its own instance name.
+
+        Args:
+            name (str): Name of instance configuration to use.
+            instance_name (str): Name of the instance to create.
+
+        Raises:
+            LXDInstanceConfigNotFoundError:
+                Raised if configuration does not exist in registry.
+
+        Returns:
+            (Dict[str, Any]): Payload to pass to the LXD API.
+        """
+        if name not in self.__payloads:
+            self.__payloads[name] = self.get_instance_config(name).dict()
 
-        raise LXDInstanceConfigNotFoundError(f"Could not find instance {name}.")
+        return {**self.__payloads[name], "name": instance_name}
@@ -7,6 +7,11 @@
 from typing import Dict, List, Optional, Tuple, Union
 
 from cleantest.meta.mixins import DictLike, EnhancedEnum
+from cleantest.meta.mixins.dict_like import _fields
+
+# Keys that must be set on an instance configuration and its source.
+_REQUIRED_CONFIG_KEYS = frozenset({"name", "type"})
+_REQUIRED_SOURCE_KEYS = frozenset({"server", "alias", "protocol", "mode"})
 
 
 class BadLXDConfigError(Exception):
@@ -32,6 +37,15 @@ class ClientConfig(DictLike):
         project (Optional[str]): Name of the LXD project to interact with (Default: None).
     """
 
+    __slots__ = (
+        "endpoint",
+        "version",
+        "cert",
+        "verify",
+        "timeout",
+        "project",
+    )
+
     def __init__(
         self,
         endpoint: Optional[str] = None,
@@ -50,11 +64,11 @@ class ClientConfig(DictLike):
 
     def __repr__(self) -> str:
         """String representation of ClientConfig."""
-        attrs = ", ".join(f"{k}={v}" for k, v in self.__dict__.items())
+        attrs = ", ".join(f"{k}={v}" for k, v in _fields(self).items())
         return f"{self.__class__.__name__}({attrs})"
 
 
-class InstanceSource:
+class InstanceSource(DictLike):
     """Define an LXD instance source to use for a test environment instance.
 
     Args:
@@ -89,6 +103,27 @@ class InstanceSource:
             Existing instance name or snapshot for copy. (Default: None)
     """
 
+    __slots__ = (
+        "alias",
+        "type",
+        "mode",
+        "server",
+        "protocol",
+        "allow_inconsistent",
+        "base_image",
+        "certificate",
+        "fingerprint",
+        "instance_only",
+        "live",
+        "operation",
+        "project",
+        "properties",
+        "refresh",
+        "secret",
+        "secrets",
+        "source",
+    )
+
     def __init__(
         self,
         alias: str,
@@ -144,7 +179,7 @@ class InstanceSource:
 
     def __repr__(self) -> str:
         """String representation of InstanceSource."""
-        attrs = ", ".join(f"{k}={v}" for k, v in self.__dict__.items())
+        attrs = ", ".join(f"{k}={v}" for k, v in _fields(self).items())
         return f"{self.__class__.__name__}({attrs})"
 
 
@@ -172,6 +207,21 @@ class InstanceConfig(DictLike):
             Type of instance. i.e. "container" or "vm". (Default: "container").
     """
 
+    __slots__ = (
+        "name",
+        "source",
+        "type",
+        "architecture",
+        "config",
+        "description",
+        "devices",
+        "ephemeral",
+        "instance_type",
+        "profiles",
+        "restore",
+        "stateful",
+    )
+
     def __init__(
         self,
         name: str,
@@ -218,20 +268,23 @@ class InstanceConfig(DictLike):
             BadLXDConfigError:
                 Raised if the passed LXD instance configuration is invalid.
         """
-        checks = ["name", "server", "alias", "protocol", "type", "mode"]
-        for i in checks:
-            if i not in self.keys(all_keys=True):
-                raise BadLXDConfigError(
-                    (
-                        f"Bad instance configuration: {self.dict()}. "
-                        "Please ensure instance configuration has the "
-                        f"following values set: {', '.join(checks)}."
-                    )
+        source = self.source if isinstance(self.source, dict) else _fields(self.source)
+        if (
+            not _REQUIRED_CONFIG_KEYS <= _fields(self).keys()
+            or not isinstance(source, dict)
+            or not _REQUIRED_SOURCE_KEYS <= source.keys()
+        ):
+            raise BadLXDConfigError(
+                (
+                    f"Bad instance configuration: {self.dict()}. "
+                    "Please ensure instance configuration has the "
+                    "following values set: name, server, alias, protocol, type, mode."
                 )
+            )
 
     def __repr__(self) -> str:
         """String representation of InstanceConfig."""
-        attrs = ", ".join(f"{k}={v}" for k, v in self.__dict__.items())
+        attrs = ", ".join(f"{k}={v}" for k, v in _fields(self).items())
         return f"{self.__class__.__name__}({attrs})"
 
 
@@ -7,7 +7,6 @@
 import os
 import pathlib
 import tarfile
-import tempfile
 from io import BytesIO
 from typing import Iterable, Union
 
@@ -76,13 +75,10 @@ class Dir(File):
         if self.src.is_file():
             raise NotADirectoryError(f"{self.src} is a file. Use File class instead.")
 
-        _ = os.getcwd()
-        os.chdir(os.sep.join(str(self.src).split(os.sep)[:-1]))
-        with tempfile.NamedTemporaryFile() as fin:
-            with tarfile.open(fin.name, "w:gz") as tar:
-                tar.add(self.src.name)
-            self.__data = pathlib.Path(fin.name).read_bytes()
-        os.chdir(_)
+        buf = BytesIO()
+        with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+            tar.add(self.src, arcname=self.src.name)
+        self.__data = buf.getvalue()
 
     def dump(self) -> None:
         """Dump directory to specified destination.
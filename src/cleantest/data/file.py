@@ -5,17 +5,38 @@
 """Abstractions for uploading and downloading files from test environments."""
 
 import copy
-import os
 import pathlib
 import shutil
+import string
 import tarfile
-import tempfile
-import textwrap
 from io import BytesIO, StringIO
 from typing import Dict, Union
 
 from cleantest.meta import Injectable
 
+# Templates for injectable scripts that push or pull objects.
+_INJECTABLE_TEMPLATES = {
+    "push": string.Template(
+        "#!/usr/bin/env python3\n"
+        "\n"
+        "from $module import $cls\n"
+        "\n"
+        '_ = $cls._loads("$checksum", "$data")\n'
+        "_.dump()"
+    ),
+    "pull": string.Template(
+        "#!/usr/bin/env python3\n"
+        "import json\n"
+        "import sys\n"
+        "\n"
+        "from $module import $cls\n"
+        "\n"
+        '_ = $cls._loads("$checksum", "$data")\n'
+        "_.load()\n"
+        "print(json.dumps(_._dumps(mode='push')), file=sys.stdout)"
+    ),
+}
+
 
 class FileError(Exception):
     """Base error for File class."""
@@ -55,40 +76,35 @@ class File(Injectable):
             FileNotFoundError: Raised if file is not found.
             FileError: Raised if source is a directory rather than a file.
         """
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            _ = pathlib.Path(tmp_dir)
-            with tarfile.open(pathlib.Path(tmp_dir) / "_", "w:gz") as tar:
-                old_pwd = os.getcwd()
-                os.chdir(_)
-                if type(self.src) == str or isinstance(self.src, pathlib.Path):
-                    data = pathlib.Path(self.src)
-                    if data.exists() is False:
-                        raise FileNotFoundError(f"Could not find {self.src}.")
-
-                    if data.is_dir():
-                        raise FileError(
-                            f"{self.src} is a directory. Use Dir class instead."
-                        )
-                    shutil.copy(data, _ / "data")
-                    tar.add("data")
-                elif isinstance(self.src, StringIO) or isinstance(self.src, BytesIO):
-                    data = copy.deepcopy(self.src)
-                    placeholder = pathlib.Path("data")
-                    placeholder.write_text(data.read()) if isinstance(
-                        self.src, StringIO
-                    ) else placeholder.write_bytes(data.read())
-                    tar.add(placeholder)
-                else:
+        buf = BytesIO()
+        with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+            if isinstance(self.src, (str, pathlib.Path)):
+                data = pathlib.Path(self.src)
+                if data.exists() is False:
+                    raise FileNotFoundError(f"Could not find {self.src}.")
+
+                if data.is_dir():
                     raise FileError(
-                        (
-                            "Expected type str, os.PathLike, StringIO, or BytesIO, "
-                            f"not {type(self.src)}."
-                        )
+                        f"{self.src} is a directory. Use Dir class instead."
                     )
+                tar.add(data, arcname="data")
+            elif isinstance(self.src, StringIO) or isinstance(self.src, BytesIO):
+                data = copy.deepcopy(self.src).read()
+                if isinstance(self.src, StringIO):
+                    data = data.encode()
+                placeholder = tarfile.TarInfo("data")
+                placeholder.size = len(data)
+                placeholder.mode = 0o644
+                tar.addfile(placeholder, BytesIO(data))
+            else:
+                raise FileError(
+                    (
+                        "Expected type str, os.PathLike, StringIO, or BytesIO, "
+                        f"not {type(self.src)}."
+                    )
+                )
 
-                os.chdir(old_pwd)
-
-            self.__data = pathlib.Path(tar.name).read_bytes()
+        self.__data = buf.getvalue()
 
     def dump(self) -> None:
         """Dump directory to specified destination.
@@ -108,11 +124,11 @@ class File(Injectable):
         if self.__data is None:
             raise FileError("Nothing to write.")
 
-        with tempfile.TemporaryDirectory() as tmp_dir, tarfile.open(
-            fileobj=BytesIO(self.__data), mode="r:gz"
-        ) as tar:
-            tar.extractall(tmp_dir)
-            shutil.copy((pathlib.Path(tmp_dir) / "data"), self.dest)
+        with tarfile.open(fileobj=BytesIO(self.__data), mode="r:gz") as tar:
+            member = tar.getmember("data")
+            with tar.extractfile(member) as fin, self.dest.open("wb") as fout:
+                shutil.copyfileobj(fin, fout)
+            self.dest.chmod(member.mode)
 
     def _injectable(self, data: Dict[str, str], **kwargs) -> str:
         """Generate injectable script that will be run inside the test environment.
@@ -132,34 +148,16 @@ class File(Injectable):
         """
         _ = kwargs.get("mode", None)
         if _ not in {"push", "pull"}:
-            InjectableModeError(
+            raise InjectableModeError(
                 f"Invalid mode: {_}. Please set mode to either 'push' or 'pull'."
             )
-        elif _ == "push":
-            return textwrap.dedent(
-                f"""
-                #!/usr/bin/env python3
-
-                from {self.__module__} import {self.__class__.__name__}
-
-                _ = {self.__class__.__name__}._loads("{data['checksum']}", "{data['data']}")
-                _.dump()
-                """
-            ).strip("\n")
         else:
-            return textwrap.dedent(
-                f"""
-                #!/usr/bin/env python3
-                import json
-                import sys
-
-                from {self.__module__} import {self.__class__.__name__}
-
-                _ = {self.__class__.__name__}._loads("{data['checksum']}", "{data['data']}")
-                _.load()
-                print(json.dumps(_._dumps()), file=sys.stdout)
-                """
-            ).strip("\n")
+            return _INJECTABLE_TEMPLATES[_].substitute(
+                module=self.__module__,
+                cls=self.__class__.__name__,
+                checksum=data["checksum"],
+                data=data["data"],
+            )
 
     def __repr__(self) -> str:
         """String representation of File."""
@@ -6,9 +6,9 @@
 
 import json
 import pathlib
+import string
 import subprocess
 import sys
-import textwrap
 from shutil import which
 from typing import Dict, List, Union
 
@@ -16,6 +16,16 @@ from cleantest.meta import BasePackage, BasePackageError
 from cleantest.meta.mixins import SnapdSupport
 from cleantest.utils import snap
 
+# Template for injectable script that runs the package handler.
+_INJECTABLE_TEMPLATE = string.Template(
+    "#!/usr/bin/env python3\n"
+    "\n"
+    "from $module import $cls\n"
+    "\n"
+    'holder = $cls._loads("$checksum", "$data")\n'
+    "holder._run()"
+)
+
 
 class CharmlibPackageError(BasePackageError):
     """Base error for Charmlib package handler."""
@@ -35,7 +45,7 @@ class Charmlib(BasePackage, SnapdSupport):
         charmlibs: Union[str, List[str]],
     ) -> None:
         self.auth_token_path = pathlib.Path(auth_token_path)
-        self.charmlibs = [charmlibs] if type(charmlibs) == str else charmlibs
+        self.charmlibs = [charmlibs] if isinstance(charmlibs, str) else charmlibs
         self._auth_token = None
 
         if auth_token_path is None:
@@ -116,13 +126,9 @@ class Charmlib(BasePackage, SnapdSupport):
         Returns:
             (str): Injectable script.
         """
-        return textwrap.dedent(
-            f"""
-            #!/usr/bin/env python3
-
-            from {self.__module__} import {self.__class__.__name__}
-
-            holder = {self.__class__.__name__}._loads("{data['checksum']}", "{data['data']}")
-            holder._run()
-            """
-        ).strip("\n")
+        return _INJECTABLE_TEMPLATE.substitute(
+            module=self.__module__,
+            cls=self.__class__.__name__,
+            checksum=data["checksum"],
+            data=data["data"],
+        )
@@ -4,9 +4,10 @@
 
 """Manager for installing pip packages inside remote processes."""
 
+import functools
 import pathlib
+import string
 import subprocess
-import textwrap
 from shutil import which
 from typing import Dict, List, Union
 
@@ -14,6 +15,33 @@ from cleantest.meta import BasePackage, BasePackageError
 from cleantest.meta.utils import detect_os_variant
 from cleantest.utils import apt
 
+# Template for injectable script that runs the package handler.
+_INJECTABLE_TEMPLATE = string.Template(
+    "#!/usr/bin/env python3\n"
+    "\n"
+    "from $module import $cls\n"
+    "\n"
+    'holder = $cls._loads("$checksum", "$data")\n'
+    "holder._run()"
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_file(path: pathlib.Path, mtime_token: int) -> str:
+    """Read a requirements or constraints file.
+
+    Contents are cached by `mtime_token` so that a file is only
+    re-read if it has been modified.
+
+    Args:
+        path (pathlib.Path): Path to file.
+        mtime_token (int): Modification time of file.
+
+    Returns:
+        (str): Contents of file.
+    """
+    return path.read_text()
+
 
 class PipPackageError(BasePackageError):
     """Base error for Pip package handler."""
@@ -37,20 +65,22 @@ class Pip(BasePackage):
         requirements: Union[str, List[str]] = None,
         constraints: Union[str, List[str]] = None,
     ) -> None:
-        self.packages = [packages] if type(packages) == str else packages
+        self.packages = [packages] if isinstance(packages, str) else packages
         self.requirements = (
-            [requirements] if type(requirements) == str else requirements
+            [requirements] if isinstance(requirements, str) else requirements
         )
         self._requirements_store = []
-        self.constraints = [constraints] if type(constraints) == str else constraints
+        self.constraints = (
+            [constraints] if isinstance(constraints, str) else constraints
+        )
         self._constraints_store = []
 
         lint_rules = [
             lambda: True if packages is None and requirements is None else False,
             lambda: True if requirements is None and constraints is not None else False,
             lambda: True
-            if type(requirements) == list
-            and type(constraints) == list
+            if isinstance(requirements, list)
+            and isinstance(constraints, list)
             and len(requirements) != len(constraints)
             else False,
         ]
@@ -74,91 +104,51 @@ class Pip(BasePackage):
             NotImplementedError: Raised if unsupported operating system is
                 being used for a test environment.
         """
-        os_variant = detect_os_variant()
+        if which("pip") is not None:
+            return
 
-        if which("pip") is None:
-            if os_variant == "ubuntu":
-                apt.install("python3-pip")
-            else:
-                raise NotImplementedError(
-                    f"Support for {os_variant.capitalize()} not available yet."
-                )
+        os_variant = detect_os_variant()
+        if os_variant == "ubuntu":
+            apt.install("python3-pip")
+        else:
+            raise NotImplementedError(
+                f"Support for {os_variant.capitalize()} not available yet."
+            )
 
     def _handle_pip_install(self) -> None:
         """Install packages inside test environment using pip.
 
+        Packages, requirements files, and constraints files are all passed
+        to a single `pip install` invocation.
+
         Raises:
             PipPackageError: Raised if error is encountered when installing packages with pip.
         """
+        cmd = ["python3", "-m", "pip", "install"]
         if self.packages is not None:
-            cmd = ["python3", "-m", "pip", "install", " ".join(self.packages)]
-            try:
-                subprocess.run(
-                    cmd,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    check=True,
-                )
-            except subprocess.CalledProcessError:
-                raise PipPackageError(
-                    f"Failed to install packages {self.packages} "
-                    f"using the following command {' '.join(cmd)}"
-                )
-
-        if self._constraints_store:
-            for requirement, constraint in zip(
-                self._requirements_store, self._constraints_store
-            ):
-                requirement_file = pathlib.Path.home().joinpath("requirements.txt")
-                requirement_file.write_text(requirement)
-                constraint_file = pathlib.Path.home().joinpath("constraints.txt")
-                constraint_file.write_text(constraint)
-                cmd = [
-                    "python3",
-                    "-m",
-                    "pip",
-                    "install",
-                    "-r",
-                    str(requirement_file),
-                    "-c",
-                    str(constraint_file),
-                ]
-                try:
-                    subprocess.run(
-                        cmd,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                        check=True,
-                    )
-                except subprocess.CalledProcessError:
-                    raise PipPackageError(
-                        (
-                            f"Failed to install packages listed in requirements.txt file {requirement} "
-                            f"with constraints.txt file {constraint} using the "
-                            f"following command: {' '.join(cmd)}"
-                        )
-                    )
-        else:
-            for requirement in self._requirements_store:
-                requirement_file = pathlib.Path(
-                    pathlib.Path.home().joinpath("requirements.txt")
-                )
-                requirement_file.write_text(requirement)
-                cmd = ["python3", "-m", "pip", "install", "-r", str(requirement_file)]
-                try:
-                    subprocess.run(
-                        cmd,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                        check=True,
-                    )
-                except subprocess.CalledProcessError:
-                    raise PipPackageError(
-                        (
-                            f"Failed to install packages listed in requirements.txt file {requirement} "
-                            f"using the following command: {' '.join(cmd)}"
-                        )
-                    )
+            cmd.extend(self.packages)
+
+        home = pathlib.Path.home()
+        for flag, kind, store in (
+            ("-r", "requirements", self._requirements_store),
+            ("-c", "constraints", self._constraints_store),
+        ):
+            for i, content in enumerate(store):
+                fout = home.joinpath(f"{kind}_{i}.txt")
+                fout.write_text(content)
+                cmd.extend([flag, str(fout)])
+
+        try:
+            subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=True,
+            )
+        except subprocess.CalledProcessError:
+            raise PipPackageError(
+                f"Failed to install packages using the following command: {' '.join(cmd)}"
+            )
 
     def _dumps(self) -> Dict[str, str]:
         """Prepare Pip object for injection.
@@ -173,25 +163,39 @@ class Pip(BasePackage):
                 injectable (str): Injectable to run inside remote environment.
         """
         if self.requirements is not None:
-            for requirement in self.requirements:
-                fin = pathlib.Path(requirement)
-                if not fin.exists() or not fin.is_file():
-                    raise FileNotFoundError(
-                        f"Could not find requirements file {requirement}."
-                    )
-                self._requirements_store.append(fin.read_text())
+            self._requirements_store = [
+                self._load_file(requirement, "requirements")
+                for requirement in self.requirements
+            ]
 
         if self.constraints is not None:
-            for constraint in self.constraints:
-                fin = pathlib.Path(constraint)
-                if not fin.exists() or not fin.is_file():
-                    raise FileNotFoundError(
-                        f"Could not find constraints file {constraint}."
-                    )
-                self._constraints_store.append(fin.read_text())
+            self._constraints_store = [
+                self._load_file(constraint, "constraints")
+                for constraint in self.constraints
+            ]
 
         return super()._dumps()
 
+    @staticmethod
+    def _load_file(file: str, kind: str) -> str:
+        """Load the contents of a requirements or constraints file.
+
+        Args:
+            file (str): Path to file.
+            kind (str): Kind of file. i.e. "requirements" or "constraints".
+
+        Raises:
+            FileNotFoundError: Raised if file is not found.
+
+        Returns:
+            (str): Contents of file.
+        """
+        fin = pathlib.Path(file)
+        if not fin.is_file():
+            raise FileNotFoundError(f"Could not find {kind} file {file}.")
+
+        return _read_file(fin, fin.stat().st_mtime_ns)
+
     def _injectable(self, data: Dict[str, str], **kwargs) -> str:
         """Generate injectable script that will be used to install packages with pip.
 
@@ -204,13 +208,9 @@ class Pip(BasePackage):
         Returns:
             (str): Injectable script.
         """
-        return textwrap.dedent(
-            f"""
-            #!/usr/bin/env python3
-
-            from {self.__module__} import {self.__class__.__name__}
-
-            holder = {self.__class__.__name__}._loads("{data['checksum']}", "{data['data']}")
-            holder._run()
-            """
-        ).strip("\n")
+        return _INJECTABLE_TEMPLATE.substitute(
+            module=self.__module__,
+            cls=self.__class__.__name__,
+            checksum=data["checksum"],
+            data=data["data"],
+        )
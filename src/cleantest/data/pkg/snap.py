@@ -4,20 +4,103 @@
 
 """Manager for installing snap packages inside remote processes."""
 
+import hashlib
+import mmap
+import os
 import pathlib
-import textwrap
+import string
 from enum import Enum
-from typing import Dict, List, Union
+from typing import Any, Dict, List, Optional, Set, Union
 
 from cleantest.meta import BasePackage, BasePackageError
 from cleantest.meta.mixins import SnapdSupport
 from cleantest.utils import snap
 
+# Template for injectable script that runs the package handler.
+_INJECTABLE_TEMPLATE = string.Template(
+    "#!/usr/bin/env python3\n"
+    "\n"
+    "from $module import $cls\n"
+    "\n"
+    'holder = $cls._loads("$checksum", "$data")\n'
+    "holder._run()"
+)
+
+# Names that refer to the snap providing system slots.
+_SYSTEM_SNAPS = {None: "system", "core": "system", "snapd": "system"}
+
 
 class SnapPackageError(BasePackageError):
     """Base error for Snap package handler."""
 
 
+def _file_digest(path: pathlib.Path) -> str:
+    """Compute the checksum of a file without reading it into memory all at once.
+
+    Args:
+        path (pathlib.Path): Path to file.
+
+    Returns:
+        (str): SHA224 checksum of file.
+    """
+    if path.stat().st_size == 0:
+        return hashlib.sha224().hexdigest()
+
+    with path.open("rb") as fin, mmap.mmap(
+        fin.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        return hashlib.sha224(mm).hexdigest()
+
+
+def _write_uncached(path: pathlib.Path, data: bytes) -> None:
+    """Write data to a file and drop the written pages from the page cache.
+
+    Local snaps are copied by snapd into its own store, so there is no
+    reason to keep the temporary copy in the page cache.
+
+    Args:
+        path (pathlib.Path): Path to file.
+        data (bytes): Data to write to file.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+        os.fdatasync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+def _batches(operations: List[Any]) -> List[List[Any]]:
+    """Split snap operations into batches that can be queued together.
+
+    snapd refuses a new change for a snap that already has a change in
+    progress, so no two operations in a batch touch the same snap. Operations
+    that touch the same snap keep their relative order.
+
+    Args:
+        operations (List[Any]): Connections and aliases to split into batches.
+
+    Returns:
+        (List[List[Any]]): Batches of operations.
+    """
+    batches = []
+    last_batch = {}
+    for operation in operations:
+        snaps = operation._snaps()
+        i = max(
+            (last_batch[name] + 1 for name in snaps if name in last_batch), default=0
+        )
+        if i == len(batches):
+            batches.append([])
+        batches[i].append(operation)
+        last_batch.update((name, i) for name in snaps)
+
+    return batches
+
+
 class Confinement(Enum):
     """Confinement modes for snap packages."""
 
@@ -87,16 +170,41 @@ class Connection:
                 "Slot must at least have an associated snap or name."
             )
 
+    def _snaps(self) -> Set[str]:
+        """Get the snaps that are changed by the `snap connect` operation.
+
+        Returns:
+            (Set[str]): Names of snaps. Slots without a snap are provided by the system.
+        """
+        slot_snap = self._slot.snap if self._slot is not None else None
+        return {self._plug.snap, _SYSTEM_SNAPS.get(slot_snap, slot_snap)}
+
     def connect(self) -> None:
         """Perform `snap connect` operation."""
         snap.connect(
-            self._plug.snap,
             self._plug.name,
-            self._slot.snap,
-            self._slot.name,
+            self._plug.snap,
+            self._slot.snap if self._slot is not None else None,
+            self._slot.name if self._slot is not None else None,
             wait=self._wait,
         )
 
+    def queue(self) -> Optional[str]:
+        """Queue `snap connect` operation without waiting for it to complete.
+
+        Returns:
+            (Optional[str]): ID of the change performing the operation.
+                None if the operation should not be waited on.
+        """
+        change = snap.connect(
+            self._plug.name,
+            self._plug.snap,
+            self._slot.snap if self._slot is not None else None,
+            self._slot.name if self._slot is not None else None,
+            wait=False,
+        )
+        return change if self._wait else None
+
 
 class Alias:
     """Represents `snap alias`.
@@ -136,10 +244,30 @@ class Alias:
             )
             raise SnapPackageError(f"Invalid alias: {holder} cannot be None.")
 
+    def _snaps(self) -> Set[str]:
+        """Get the snaps that are changed by the `snap alias` operation.
+
+        Returns:
+            (Set[str]): Names of snaps.
+        """
+        return {self._snap_name}
+
     def alias(self) -> None:
         """Perform `snap alias` operation."""
         snap.alias(self._snap_name, self._app_name, self._alias_name, self._wait)
 
+    def queue(self) -> Optional[str]:
+        """Queue `snap alias` operation without waiting for it to complete.
+
+        Returns:
+            (Optional[str]): ID of the change performing the operation.
+                None if the operation should not be waited on.
+        """
+        change = snap.alias(
+            self._snap_name, self._app_name, self._alias_name, wait=False
+        )
+        return change if self._wait else None
+
 
 class Snap(BasePackage, SnapdSupport):
     """Represents `snap install`.
@@ -171,9 +299,11 @@ class Snap(BasePackage, SnapdSupport):
         connections: List[Connection] = None,
         aliases: List[Alias] = None,
     ) -> None:
-        self.snaps = [snaps] if type(snaps) == str else snaps
-        self.local_snaps = [local_snaps] if type(local_snaps) == str else local_snaps
-        self._cached_local_snaps = set()
+        self.snaps = [snaps] if isinstance(snaps, str) else snaps
+        self.local_snaps = (
+            [local_snaps] if isinstance(local_snaps, str) else local_snaps
+        )
+        self._cached_local_snaps = {}
         self.confinement = confinement
         self.channel = channel
         self.cohort = cohort
@@ -184,10 +314,10 @@ class Snap(BasePackage, SnapdSupport):
         if snaps is None and local_snaps is None:
             raise SnapPackageError("No snaps specified.")
 
-        if not hasattr(Confinement, confinement.name):
+        if not isinstance(confinement, Confinement):
             raise SnapPackageError(
-                f"Invalid confinement {confinement.name}. "
-                f"Must be either {', '.join([i.name for i in Confinement])}"
+                f"Invalid confinement {confinement!r}. "
+                f"Must be either {', '.join(i.name for i in Confinement)}"
             )
 
     def _run(self) -> None:
@@ -201,31 +331,63 @@ class Snap(BasePackage, SnapdSupport):
 
     def _handle_snap_install(self) -> None:
         """Install snap packages inside test environment."""
+        classic = self.confinement is Confinement.CLASSIC
+        devmode = self.confinement is Confinement.DEVMODE
         if self.snaps is not None:
             snap.install(
                 self.snaps,
                 channel=self.channel,
-                classic=True if self.confinement == Confinement.CLASSIC else False,
-                cohort=self.cohort if self.cohort is not None else "",
+                classic=classic,
+                cohort=self.cohort or "",
             )
 
-        for pkg in self._cached_local_snaps:
-            path = pathlib.Path.home().joinpath("tmp.snap")
-            path.write_bytes(pkg)
-            snap.install_local(
-                str(path),
-                classic=True if self.confinement == Confinement.CLASSIC else False,
-                devmode=True if self.confinement == Confinement.DEVMODE else False,
-                dangerous=self.dangerous,
+        changes = []
+        path = pathlib.Path.home().joinpath("tmp.snap")
+        for pkg in self._cached_local_snaps.values():
+            _write_uncached(path, pkg)
+            changes.append(
+                snap.install_local(
+                    str(path),
+                    classic=classic,
+                    devmode=devmode,
+                    dangerous=self.dangerous,
+                    wait=False,
+                )
             )
+        self._wait_all(changes)
+
+        # Operations on different snaps are queued together; operations on
+        # the same snap land in later batches so they do not conflict.
+        for batch in _batches([*(self.connections or []), *(self.aliases or [])]):
+            self._wait_all([operation.queue() for operation in batch])
+
+    @staticmethod
+    def _wait_all(changes: List[Optional[str]]) -> None:
+        """Wait for queued snapd changes to finish.
+
+        Args:
+            changes (List[Optional[str]]): IDs of changes to wait for.
+                Changes that are None are skipped.
+        """
+        for change in changes:
+            if change is not None:
+                snap.watch(change)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get state of Snap object for pickling.
 
-        if self.connections is not None:
-            for connection in self.connections:
-                connection.connect()
+        Local snap packages are only read into memory while the Snap object
+        is being serialized rather than being held for the object's lifetime.
 
-        if self.aliases is not None:
-            for alias in self.aliases:
-                alias.alias()
+        Returns:
+            (Dict[str, Any]): State of Snap object with local snaps loaded.
+        """
+        state = self.__dict__.copy()
+        state["_cached_local_snaps"] = {
+            digest: pkg.read_bytes() if isinstance(pkg, pathlib.Path) else pkg
+            for digest, pkg in self._cached_local_snaps.items()
+        }
+        return state
 
     def _dumps(self) -> Dict[str, str]:
         """Prepare Snap object for injection.
@@ -246,7 +408,7 @@ class Snap(BasePackage, SnapdSupport):
                     raise FileNotFoundError(
                         f"Could not find local snap package {snap_path}"
                     )
-                self._cached_local_snaps.add(snap_path.read_bytes())
+                self._cached_local_snaps.setdefault(_file_digest(snap_path), snap_path)
 
         return super()._dumps()
 
@@ -262,13 +424,9 @@ class Snap(BasePackage, SnapdSupport):
         Returns:
             (str): Injectable script.
         """
-        return textwrap.dedent(
-            f"""
-            #!/usr/bin/env python3
-
-            from {self.__module__} import {self.__class__.__name__}
-
-            holder = {self.__class__.__name__}._loads("{data['checksum']}", "{data['data']}")
-            holder._run()
-            """
-        ).strip("\n")
+        return _INJECTABLE_TEMPLATE.substitute(
+            module=self.__module__,
+            cls=self.__class__.__name__,
+            checksum=data["checksum"],
+            data=data["data"],
+        )
@@ -4,14 +4,54 @@
 
 """Abstract class for test environment instance handlers."""
 
+import ast
+import functools
 import re
-import tempfile
+import textwrap
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Pattern, Tuple, Union
 
 from .result import Result
 
 
+@functools.lru_cache(maxsize=None)
+def _fuse_patterns(patterns: Tuple[Union[str, Pattern], ...]) -> Pattern:
+    """Fuse multiple regex patterns into a single alternation.
+
+    Args:
+        patterns (Tuple[Union[str, Pattern], ...]): Patterns to fuse.
+
+    Returns:
+        (Pattern): Compiled pattern matching any of the given patterns.
+    """
+    return re.compile(
+        "|".join(f"(?:{getattr(pattern, 'pattern', pattern)})" for pattern in patterns)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _strip_decorators(src: str, remove: Tuple[Pattern, ...]) -> str:
+    """Strip decorators from the source code of a function.
+
+    Args:
+        src (str): Source code of function.
+        remove (Tuple[Pattern, ...]): Patterns of decorators to remove.
+
+    Returns:
+        (str): Source code of function without matching decorators.
+    """
+    src = textwrap.dedent(src)
+    lines = src.splitlines(keepends=True)
+    pattern = _fuse_patterns(remove)
+    drop = set()
+    for node in ast.parse(src).body[0].decorator_list:
+        span = range(node.lineno - 1, node.end_lineno)
+        if pattern.match("".join(lines[i] for i in span)):
+            drop.update(span)
+
+    return "".join(line for i, line in enumerate(lines) if i not in drop)
+
+
 class BaseEntrypointError(Exception):
     """Base error for test run entrypoints."""
 
@@ -68,7 +108,7 @@ class BaseHarness(ABC):
         Args:
             src (str): Source code of testlet.
             name (str): Name of testlet.
-            remove (List[Any]): String patterns to remove from source code in regex form.
+            remove (List[Any]): Patterns of decorators to remove from source code.
 
         Returns:
             (str): Injectable testlet.
@@ -77,17 +117,12 @@ class BaseHarness(ABC):
             This will need more advanced logic if tests accept arguments.
         """
         if remove is not None:
-            for pattern in remove:
-                src = re.sub(pattern, "", src)
+            src = _strip_decorators(src, tuple(remove))
 
-        with tempfile.TemporaryFile(mode="w+t") as _:
-            content = [
+        return "".join(
+            [
                 "#!/usr/bin/env python3\n",
                 f"{src}\n",
                 f"{name}()\n",
             ]
-            _.writelines(content)
-            _.seek(0)
-            testlet = _.read()
-
-        return testlet
+        )
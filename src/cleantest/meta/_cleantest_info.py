@@ -6,18 +6,39 @@
 
 import base64
 import csv
+import functools
 import hashlib
-import os
 import pathlib
+import string
 import tarfile
-import tempfile
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from typing import Dict, Iterable, Tuple
 
 import pkg_resources
 
+import cleantest
 from cleantest.meta.utils import thread_count
 
+# Template for injectable script that installs the cleantest bundle in test instance.
+_INJECTABLE_TEMPLATE = string.Template(
+    "#!/usr/bin/env python3\n"
+    "import base64\n"
+    "import hashlib\n"
+    "import site\n"
+    "import tarfile\n"
+    "from io import BytesIO\n"
+    "_ = base64.b64decode('$data')\n"
+    "if '$checksum' != hashlib.sha224(_).hexdigest():\n"
+    "\traise Exception('Hashes do not match')\n"
+    "bundle = tarfile.open(fileobj=BytesIO(_))\n"
+    "for member in bundle.getmembers():\n"
+    "\ttar = tarfile.open(fileobj=bundle.extractfile(member), mode='r:gz')\n"
+    "\ttar.extractall(site.getsitepackages()[0])\n"
+    "\ttar.close()\n"
+    "bundle.close()\n"
+)
+
 
 def _dependency_processor(dependency: pkg_resources.Distribution) -> Dict[str, bytes]:
     """Collect source code of cleantest dependency.
@@ -28,15 +49,62 @@ def _dependency_processor(dependency: pkg_resources.Distribution) -> Dict[str, b
     Returns:
         (Dict[str, bytes]): Name and base64 encoded source code of dependency.
     """
-    os.chdir(dependency.location)
-    with tempfile.NamedTemporaryFile() as fin:
-        with tarfile.open(fin.name, "w:gz") as tar, pathlib.Path(
-            f"{dependency.key.replace('-', '_')}-{dependency.version}.dist-info"
-        ).joinpath("RECORD").open(mode="rt") as dist_info_fin:
+    location = pathlib.Path(dependency.location)
+    record = location.joinpath(
+        f"{dependency.key.replace('-', '_')}-{dependency.version}.dist-info", "RECORD"
+    )
+    buf = BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz", compresslevel=1) as tar:
+        with record.open(mode="rt") as dist_info_fin:
             for row in csv.reader(dist_info_fin):
-                tar.add(row[0])
+                tar.add(location.joinpath(row[0]), arcname=row[0])
+
+    return {dependency.key: buf.getvalue()}
+
+
+@functools.lru_cache(maxsize=1)
+def _dependency_archiver(
+    dependencies: Tuple[pkg_resources.Distribution, ...]
+) -> Tuple[Tuple[str, bytes], ...]:
+    """Archive the source code of cleantest's dependencies.
+
+    Archives are cached by `dependencies` so that dependencies are only
+    re-archived if the resolved working set changes.
+
+    Args:
+        dependencies (Tuple[pkg_resources.Distribution, ...]):
+            Resolved dependencies of cleantest.
+
+    Returns:
+        (Tuple[Tuple[str, bytes], ...]): Name and source code of dependencies.
+    """
+    with ThreadPoolExecutor(max_workers=thread_count()) as pool:
+        return tuple(
+            item
+            for res in pool.map(_dependency_processor, dependencies)
+            for item in res.items()
+        )
 
-        return {dependency.key: pathlib.Path(fin.name).read_bytes()}
+
+@functools.lru_cache(maxsize=1)
+def _source_processor(src: pathlib.Path, mtime_token: int) -> bytes:
+    """Archive the source code of cleantest.
+
+    Archives are cached by `mtime_token` so that cleantest is only
+    re-archived if one of its modules has been modified.
+
+    Args:
+        src (pathlib.Path): Path to the cleantest package.
+        mtime_token (int): Latest modification time of cleantest's modules.
+
+    Returns:
+        (bytes): Gzipped tar archive containing the source code of cleantest.
+    """
+    buf = BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz", compresslevel=1) as tar:
+        tar.add(src, arcname="cleantest")
+
+    return buf.getvalue()
 
 
 class CleantestInfo:
@@ -59,13 +127,9 @@ class CleantestInfo:
         Returns:
             (Dict[str, bytes]): Name and base64 encoded source code of cleantest module.
         """
-        _ = os.getcwd()
-        os.chdir(pkg_resources.get_distribution("cleantest").location)
-        with tempfile.NamedTemporaryFile() as fin:
-            with tarfile.open(fin.name, "w:gz") as tar:
-                tar.add("cleantest")
-            os.chdir(_)
-            return {"cleantest": pathlib.Path(fin.name).read_bytes()}
+        src = pathlib.Path(cleantest.__path__[0])
+        mtime_token = max(p.stat().st_mtime_ns for p in src.rglob("*.py"))
+        return {"cleantest": _source_processor(src, mtime_token)}
 
     @property
     def __dependencies(self) -> Iterable[Tuple[str, bytes]]:
@@ -74,16 +138,13 @@ class CleantestInfo:
         Yields:
             (Dict[str, bytes]): Name and source code of dependencies.
         """
-        with ProcessPoolExecutor(max_workers=thread_count()) as pool:
-            pool_results = pool.map(
-                _dependency_processor,
+        yield from _dependency_archiver(
+            tuple(
                 pkg_resources.working_set.resolve(
                     pkg_resources.working_set.by_key["cleantest"].requires()
-                ),
+                )
             )
-            for res in pool_results:
-                for k, v in res.items():
-                    yield k, v
+        )
 
     def __injectable(self, checksum: str, data: str) -> str:
         """Generate injectable script to install packages inside the test instance.
@@ -95,43 +156,34 @@ class CleantestInfo:
         Returns:
             (str): Injectable script.
         """
-        with tempfile.TemporaryFile(mode="w+t") as fout:
-            fout.writelines(
-                [
-                    "#!/usr/bin/env python3\n",
-                    "import base64\n",
-                    "import hashlib\n",
-                    "import site\n",
-                    "import tarfile\n",
-                    "from io import BytesIO\n",
-                    f"_ = base64.b64decode('{data}')\n",
-                    f"if '{checksum}' != hashlib.sha224(_).hexdigest():\n"
-                    "\traise Exception('Hashes do not match')\n",
-                    "tar = tarfile.open(fileobj=BytesIO(_), mode='r:gz')\n",
-                    "tar.extractall(site.getsitepackages()[0])\n",
-                    "tar.close()\n",
-                ]
-            )
-            fout.seek(0)
-            return fout.read()
+        return _INJECTABLE_TEMPLATE.substitute(checksum=checksum, data=data)
 
     def dumps(self) -> Iterable[Tuple[str, Dict[str, str]]]:
         """Prepare cleantest for injection into test environment instance.
 
+        Cleantest and its dependencies are bundled into a single archive
+        so that they can be installed with one injectable.
+
         Yields:
             (Iterable[Tuple[str, Dict[str, str]]]):
-                name (str): Name of library being injected.
+                name (str): Name of bundle being injected.
                 checksum (str): Checksum to verify authenticity of archive.
                 data (str): Base64 encoded tarball containing source code.
                 injectable (str): Injectable to run inside remote instance.
         """
         packages = self.__src
-        packages.update(dict(self.__dependencies))
-        for k, v in packages.items():
-            checksum = hashlib.sha224(v).hexdigest()
-            data = base64.b64encode(v).decode()
-            yield k, {
-                "checksum": checksum,
-                "data": data,
-                "injectable": self.__injectable(checksum, data),
-            }
+        packages.update(self.__dependencies)
+        buf = BytesIO()
+        with tarfile.open(fileobj=buf, mode="w") as bundle:
+            for k, v in packages.items():
+                info = tarfile.TarInfo(f"{k}.tar.gz")
+                info.size = len(v)
+                bundle.addfile(info, BytesIO(v))
+
+        checksum = hashlib.sha224(buf.getvalue()).hexdigest()
+        data = base64.b64encode(buf.getvalue()).decode()
+        yield "cleantest", {
+            "checksum": checksum,
+            "data": data,
+            "injectable": self.__injectable(checksum, data),
+        }
@@ -29,7 +29,7 @@ class Injectable(ABC):
         Returns:
             (object): Deserialized, verified object.
         """
-        if type(data) != str:
+        if not isinstance(data, str):
             raise InjectionError(f"Cannot load object {data}. {type(data)} != str")
 
         _ = base64.b64decode(data)
@@ -44,7 +44,7 @@ class Injectable(ABC):
             key: value for key, value in _.__dict__.items() if key.startswith("_")
         }
         new_cls = cls(*posargs)
-        [setattr(new_cls, key, value) for key, value in hiddenargs.items()]
+        new_cls.__dict__.update(hiddenargs)
         return new_cls
 
     def _dumps(self, **kwargs) -> Dict[str, str]:
@@ -4,19 +4,51 @@
 
 """Mixin for objects that need to emulate a dictionary."""
 
-from typing import Any, Dict, Iterable, Tuple
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+def _fields(obj: Any) -> Optional[Dict[str, Any]]:
+    """Get the attributes set on an object.
+
+    Attributes are read from __dict__ if the object has one. Slotted DictLike
+    objects are read from __slots__; other slotted objects are left as is.
+
+    Args:
+        obj (Any): Object to get attributes of.
+
+    Returns:
+        (Optional[Dict[str, Any]]): Attributes of object.
+            Returns None if object does not store attributes.
+    """
+    if hasattr(obj, "__dict__"):
+        return obj.__dict__
+
+    if not isinstance(obj, DictLike):
+        return None
+
+    slots = [
+        k
+        for cls in reversed(type(obj).__mro__)
+        for k in cls.__dict__.get("__slots__", ())
+    ]
+    if not slots:
+        return None
+
+    return {k: getattr(obj, k) for k in slots if hasattr(obj, k)}
 
 
 class DictLike:
     """Mixin for objects that need to emulate a dictionary."""
 
+    __slots__ = ()
+
     def dict(self) -> Dict:
         """Return class as a unidirectional dictionary.
 
         Returns:
             (Dict): Class as a dictionary.
         """
-        return self.__process_dict(self.__dict__)
+        return self.__process_dict(_fields(self))
 
     def keys(self, all_keys: bool = False) -> Iterable[Any]:
         """Get dictionary keys.
@@ -31,7 +63,7 @@ class DictLike:
             (Iterable[Any]): Iterable containing dictionary keys.
         """
         if not all_keys:
-            return iter(k for k in self.__dict__.keys())
+            return iter(k for k in _fields(self).keys())
         else:
             return self.__process_keys(self.dict())
 
@@ -48,7 +80,7 @@ class DictLike:
             (Iterable[Any]): Iterable containing dictionary values.
         """
         if not all_values:
-            return iter(v for v in self.__dict__.values())
+            return iter(v for v in _fields(self).values())
         else:
             return self.__process_values(self.dict())
 
@@ -65,29 +97,32 @@ class DictLike:
             (Iterable[Tuple[Any, Any]]): Iterable containing dictionary items.
         """
         if not all_items:
-            return iter(
-                (k, v) for k, v in zip(self.__dict__.keys(), self.__dict__.values())
-            )
+            return iter(_fields(self).items())
         else:
             return iter(
                 (k, v) for k, v in zip(self.keys(all_items), self.values(all_items))
             )
 
     def __process_dict(self, input_dict: Dict[Any, Any]) -> Dict[Any, Any]:
-        """Process dictionary containing object with __dict__ attribute recursively.
+        """Process dictionary containing objects with attributes iteratively.
 
         Args:
-            input_dict (Dict): Dictionary containing object with __dict__ attribute.
+            input_dict (Dict): Dictionary containing objects with attributes.
 
         Returns:
             (Dict): Dictionary with containing objects converted to dictionaries.
         """
         result = {}
-        for key, value in input_dict.items():
-            if hasattr(value, "__dict__"):
-                result.update({key: self.__process_dict(value.__dict__)})
-            else:
-                result.update({key: value})
+        stack = [(result, input_dict)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                nested = _fields(value)
+                if nested is None:
+                    target[key] = value
+                else:
+                    target[key] = {}
+                    stack.append((target[key], nested))
 
         return result
 
@@ -103,7 +138,7 @@ class DictLike:
         """
         result = []
         for k, v in input_dict.items():
-            if type(v) == dict:
+            if isinstance(v, dict):
                 result.extend(self.__process_keys(v))
             else:
                 result.append(k)
@@ -122,7 +157,7 @@ class DictLike:
         """
         result = []
         for k, v in input_dict.items():
-            if type(v) == dict:
+            if isinstance(v, dict):
                 result.extend(self.__process_values(v))
             else:
                 result.append(v)
@@ -4,6 +4,7 @@
 
 """Common operations needed by classes to support snapd and snap."""
 
+import functools
 from shutil import which
 
 from cleantest.meta.utils import detect_os_variant
@@ -14,6 +15,12 @@ class SnapdSupportError(Exception):
     """Base error for SnapdSupport mixin."""
 
 
+@functools.lru_cache(maxsize=1)
+def _snap_installed() -> bool:
+    """Determine if the `snap` executable is available on PATH."""
+    return which("snap") is not None
+
+
 class SnapdSupport:
     """Mixin for classes that need snapd support."""
 
@@ -26,11 +33,11 @@ class SnapdSupport:
             NotImplementedError: Raised if unsupported operating system is
                 being used for a test environment.
         """
-        os_variant = detect_os_variant()
-
-        if which("snap") is None:
+        if not _snap_installed():
+            os_variant = detect_os_variant()
             if os_variant == "ubuntu":
                 apt.install("snapd")
+                _snap_installed.cache_clear()
             else:
                 raise NotImplementedError(
                     f"Support for {os_variant.capitalize()} not available yet."
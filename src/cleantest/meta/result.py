@@ -16,6 +16,8 @@ class Result:
         stderr (Any): Captured data printed to standard error.
     """
 
+    __slots__ = ("__exit_code", "__stdout", "__stderr")
+
     def __init__(self, exit_code: int, stdout: Any, stderr: Any):
         self.__exit_code = exit_code
         self.__stdout = stdout
@@ -4,6 +4,7 @@
 
 """Detect operating system of test environment."""
 
+import pathlib
 import platform
 
 
@@ -38,7 +39,10 @@ def _determine_linux() -> str:
     Returns:
         (str): ID of the Linux distribution read from /etc/os-release.
     """
-    os_release_data = [line.strip() for line in open("/etc/os-release", "rt")]
+    os_release_data = [
+        line.strip()
+        for line in pathlib.Path("/etc/os-release").read_text().splitlines()
+    ]
     for line in os_release_data:
         if line.startswith("ID="):
             return line.split("=")[-1].lower()
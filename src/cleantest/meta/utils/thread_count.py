@@ -4,14 +4,23 @@
 
 """Detect thread count on host system."""
 
+import functools
 import os
 
 
+@functools.lru_cache(maxsize=1)
 def thread_count() -> int:
     """Get number of allowable threads on host system.
 
+    The thread count can be overridden by setting CLEANTEST_NUM_THREADS
+    to a positive integer. The result is cached after the first call.
+
     Returns:
         (int): Number of allowable threads (Default: os.cpu_count())
     """
-    env_var = os.getenv("CLEANTEST_NUM_THREADS")
-    return env_var if env_var is not None and type(env_var) == int else os.cpu_count()
+    try:
+        env_var = int(os.getenv("CLEANTEST_NUM_THREADS"))
+    except (TypeError, ValueError):
+        env_var = 0
+
+    return env_var if env_var > 0 else os.cpu_count() or 1
@@ -4,28 +4,194 @@
 
 """Handler for LXD test environment provider and instances."""
 
+import functools
 import inspect
 import json
 import re
-import tempfile
-from concurrent.futures import ProcessPoolExecutor
-from typing import Any, Callable, Iterable, List, Literal, Optional, Tuple
-
-from pylxd import Client
+import tarfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from io import BytesIO
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from cleantest.meta import BasePackage, Injectable, Result
 from cleantest.meta._base_harness import (
     BaseEntrypoint,
     BaseEntrypointError,
     BaseHarness,
+    BaseHarnessError,
 )
 from cleantest.meta._cleantest_info import CleantestInfo
+from cleantest.meta.utils import thread_count
+
+if TYPE_CHECKING:
+    from pylxd import Client
+
+_LXD_DECORATOR = re.compile(r"^@lxd\(([^)]+)\)")
+_LXD_TARGET_DECORATOR = re.compile(r"^@lxd\.target\(([^)]+)\)")
+# Size of the frames used to stream payloads into instances.
+_CHUNK_SIZE = 1 << 20
 
 
 class LXDEntrypointError(BaseEntrypointError):
     """Raise if error is encountered when starting test run with LXD."""
 
 
+class LXDHarnessError(BaseHarnessError):
+    """Raise if error is encountered when operating on an LXD test environment instance."""
+
+
+@functools.lru_cache(maxsize=None)
+def _getsource(func: Callable) -> str:
+    """Get the source code of a testlet.
+
+    Source is cached per function so that repeated calls of a decorated
+    testlet do not re-read and re-tokenize its module.
+
+    Args:
+        func (Callable): Testlet to get the source code of.
+
+    Returns:
+        (str): Source code of testlet.
+    """
+    return inspect.getsource(func)
+
+
+def _load_artifact(artifact: Injectable) -> str:
+    """Load an artifact and generate the injectable that unpacks it.
+
+    Args:
+        artifact (Injectable): Artifact to load.
+
+    Returns:
+        (str): Injectable to run inside the test environment instance.
+    """
+    artifact.load()
+    return artifact._dumps(mode="push")["injectable"]
+
+
+def _chunks(buf: BytesIO) -> Iterator[bytes]:
+    """Read a buffer from the start in fixed-size chunks.
+
+    Streaming the chunks sends the payload as a fragmented websocket message,
+    so the full payload is never copied or masked in one piece.
+
+    Args:
+        buf (BytesIO): Buffer to read.
+
+    Yields:
+        (Iterator[bytes]): Chunks of at most `_CHUNK_SIZE` bytes.
+    """
+    buf.seek(0)
+    while chunk := buf.read(_CHUNK_SIZE):
+        yield chunk
+
+
+def _push(
+    instance: Any,
+    files: Dict[str, Union[str, bytes]],
+    then: Optional[str] = None,
+    mode: int = 0o644,
+    check: bool = True,
+    **kwargs: Any,
+) -> Any:
+    """Push files into an LXD test environment instance as a single tar stream.
+
+    Parent directories of the files are created as needed. If a follow-up
+    command is given, it is run in the same execution once the files are
+    unpacked, saving a round-trip to the instance.
+
+    Args:
+        instance (Any): Instance to push files into.
+        files (Dict[str, Union[str, bytes]]): Absolute paths and contents of files.
+        then (Optional[str]):
+            Shell command to run after the files are unpacked (Default: None).
+        mode (int): Permissions to give the pushed files (Default: 0o644).
+        check (bool): Raise if the execution exits with a non-zero
+            exit code (Default: True).
+        **kwargs (Any): Extra arguments to pass to `instance.execute`.
+
+    Raises:
+        LXDHarnessError: Raised if files fail to be unpacked inside instance
+            or the follow-up command fails, unless check is False.
+
+    Returns:
+        (Any): Result of the execution.
+    """
+    buf = BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tar:
+        for path, content in files.items():
+            data = content.encode() if isinstance(content, str) else content
+            info = tarfile.TarInfo(path.lstrip("/"))
+            info.size = len(data)
+            info.mode = mode
+            tar.addfile(info, BytesIO(data))
+
+    cmd = (
+        ["tar", "-xf", "-", "-C", "/"]
+        if then is None
+        else ["sh", "-c", f"tar -xf - -C / && {then}"]
+    )
+    result = instance.execute(cmd, stdin_payload=_chunks(buf), **kwargs)
+    if check and result.exit_code != 0:
+        raise LXDHarnessError(
+            f"Failed to push {', '.join(files)} to {instance.name}"
+            f"{'' if then is None else f' and run {then!r}'}. "
+            f"Reason: {result.stderr}"
+        )
+
+    return result
+
+
+def _pull(instance: Any, artifacts: Iterable[Injectable]) -> List[Dict[str, str]]:
+    """Collect artifacts from an LXD test environment instance in one execution.
+
+    The loader for every artifact is pushed as a single tar stream and the
+    loaders are run in order. Each loader prints its serialized artifact
+    as one line of JSON.
+
+    Args:
+        instance (Any): Instance to collect artifacts from.
+        artifacts (Iterable[Injectable]): Artifacts to collect.
+
+    Raises:
+        LXDHarnessError: Raised if an artifact fails to be collected.
+
+    Returns:
+        (List[Dict[str, str]]): Checksum and data of each artifact, in order.
+    """
+    files = {
+        f"/root/.pull/load_{i:04d}": artifact._dumps(mode="pull")["injectable"]
+        for i, artifact in enumerate(artifacts)
+    }
+    result = _push(
+        instance,
+        files,
+        then=f"for f in {' '.join(files)}; do python3 $f || exit 1; rm -f $f; done",
+        check=False,
+    )
+    payloads = result.stdout.splitlines()
+    if result.exit_code != 0 or len(payloads) != len(files):
+        raise LXDHarnessError(
+            f"Failed to collect artifacts from {instance.name}. "
+            f"Reason: {result.stderr}"
+        )
+
+    return [json.loads(payload) for payload in payloads]
+
+
 class InstanceMetadata:
     """Metaclass to track key information about LXD test environments.
 
@@ -39,12 +205,15 @@ class InstanceMetadata:
             False - test environment instance does not exist (Default: False).
     """
 
+    __slots__ = ("name", "image", "exists", "handle")
+
     def __init__(
         self, name: str, image: Optional[str] = None, exists: bool = False
     ) -> None:
         self.name = name
         self.image = image
         self.exists = exists
+        self.handle = None
 
     def __repr__(self) -> str:
         """String representation of InstanceMetadata."""
@@ -57,40 +226,92 @@ class InstanceMetadata:
 class LXDHarness(BaseHarness):
     """Mixin for controlling the LXD hypervisor via its unix socket."""
 
-    @property
-    def _client(self) -> Client:
+    @functools.cached_property
+    def _client(self) -> "Client":
         """Get the connection to the LXD API socket.
 
+        The connection is opened on first access and reused afterwards.
+
         Returns:
             (Client): Connection to LXD API socket.
         """
+        from pylxd import Client
+
         return Client(**self._lxd_config.client_config.dict())
 
-    @property
+    @functools.cached_property
     def _instance_metadata(self) -> List[InstanceMetadata]:
         """Create metaclasses to track key information about LXD test environments.
 
+        The metaclasses are created on first access and reused afterwards.
+
         Returns:
             (List[InstanceMetadata]): List of metaclasses.
         """
+        existing = self._existing_names()
         return [
-            InstanceMetadata(name=f"{self._name}-{i}", image=i) for i in self._image
+            self._exists(InstanceMetadata(name=f"{self._name}-{i}", image=i), existing)
+            for i in self._image
         ]
 
-    def _exists(self, instance: InstanceMetadata) -> InstanceMetadata:
+    @functools.cached_property
+    def _cleantest_installers(self) -> Dict[str, str]:
+        """Generate the injectables that install cleantest inside new instances.
+
+        The injectables are identical for every instance, so they are
+        generated once and shared by all instances the harness initializes.
+
+        Returns:
+            (Dict[str, str]): Absolute paths and contents of the injectables.
+        """
+        return {
+            f"/root/init/cleantest/install_{name}": data["injectable"]
+            for name, data in CleantestInfo().dumps()
+        }
+
+    def _existing_names(self) -> Set[str]:
+        """Get the names of all instances known to LXD with a single request.
+
+        Returns:
+            (Set[str]): Names of existing instances.
+        """
+        return {instance.name for instance in self._client.instances.all()}
+
+    def _exists(
+        self, instance: InstanceMetadata, existing: Optional[Set[str]] = None
+    ) -> InstanceMetadata:
         """Check whether an instance exists.
 
         Args:
             instance (InstanceMetadata): Instance to check the existence of.
+            existing (Optional[Set[str]]): Names of existing instances. If None,
+                LXD is queried for the instance directly (Default: None).
 
         Returns:
             (InstanceMetadata): Update instance metadata.
         """
-        if self._client.instances.exists(instance.name):
+        if existing is not None:
+            if instance.name in existing:
+                instance.exists = True
+        elif self._client.instances.exists(instance.name):
             instance.exists = True
 
         return instance
 
+    def _handle(self, instance: InstanceMetadata) -> Any:
+        """Get the pylxd handle for an instance, fetching it on first use.
+
+        Args:
+            instance (InstanceMetadata): Instance to get the handle of.
+
+        Returns:
+            (Any): pylxd object of the instance.
+        """
+        if instance.handle is None:
+            instance.handle = self._client.instances.get(instance.name)
+
+        return instance.handle
+
     def _init(self, instance: InstanceMetadata) -> None:
         """Initialize LXD test environment instance.
 
@@ -98,22 +319,21 @@ class LXDHarness(BaseHarness):
             instance (InstanceMetadata): Instance to initialize.
         """
         if instance.exists is False:
-            config = self._lxd_config.get_instance_config(instance.image)
-            config.name = instance.name
-            self._client.instances.create(config.dict(), wait=True)
-            instance = self._client.instances.get(instance.name)
-            instance.start(wait=True)
-            meta = CleantestInfo()
-            instance.execute(["mkdir", "-p", "/root/init/cleantest"])
-            for name, data in meta.dumps():
-                instance.files.put(
-                    f"/root/init/cleantest/install_{name}",
-                    data["injectable"],
-                )
-                instance.execute(["python3", f"/root/init/cleantest/install_{name}"])
+            self._client.instances.create(
+                self._lxd_config.get_instance_payload(instance.image, instance.name),
+                wait=True,
+            )
+            handle = self._handle(instance)
+            handle.start(wait=True)
+            _push(
+                handle,
+                self._cleantest_installers,
+                then="for f in /root/init/cleantest/install_*; do python3 $f || exit 1; done",
+            )
         else:
-            if self._client.instances.get(instance.name).status.lower() == "stopped":
-                self._client.instances.get(instance.name).start(wait=True)
+            handle = self._handle(instance)
+            if handle.status.lower() == "stopped":
+                handle.start(wait=True)
 
     def _execute(self, test: str, instance: InstanceMetadata) -> Any:
         """Execute a testlet inside an LXD test environment instance.
@@ -125,10 +345,15 @@ class LXDHarness(BaseHarness):
         Returns:
             (Any): Result of the testlet.
         """
-        instance = self._client.instances.get(instance.name)
-        instance.files.put("/root/test", test)
-        instance.execute(["chmod", "+x", "/root/test"])
-        result = instance.execute(["/root/test"], environment=self._env.dump())
+        handle = self._handle(instance)
+        result = _push(
+            handle,
+            {"/root/test": test},
+            then="/root/test",
+            mode=0o755,
+            check=False,
+            environment=self._env.dump(),
+        )
         return Result(
             exit_code=result.exit_code, stdout=result.stdout, stderr=result.stderr
         )
@@ -139,9 +364,11 @@ class LXDHarness(BaseHarness):
         Args:
             instance (InstanceMetadata): Test environment instance to teardown.
         """
-        instance = self._client.instances.get(instance.name)
-        instance.stop(wait=True)
-        instance.delete(wait=True)
+        handle = self._handle(instance)
+        handle.stop(wait=True)
+        handle.delete(wait=True)
+        instance.exists = False
+        instance.handle = None
 
     def _handle_start_env_hooks(self, instance: InstanceMetadata) -> None:
         """Handle start env hooks.
@@ -150,15 +377,16 @@ class LXDHarness(BaseHarness):
             instance (InstanceMetadata): Instance to run start env hooks in.
         """
         start_env_hooks = self._lxd_config.startenv_hooks
-        while start_env_hooks:
-            hook = start_env_hooks.pop()
-            instance = self._client.instances.get(instance.name)
+        if not start_env_hooks:
+            return
+
+        handle = self._handle(instance)
+        for hook in reversed(start_env_hooks):
             if hook.packages is not None:
                 for pkg in hook.packages:
-                    self._handle_package_install(instance, pkg)
-            if hook.upload is not None:
-                for artifact in hook.upload:
-                    self._handle_artifact_upload(instance, artifact)
+                    self._handle_package_install(handle, pkg)
+            if hook.upload:
+                self._handle_artifact_upload(handle, *hook.upload)
 
     def _handle_stop_env_hooks(self, instance: InstanceMetadata) -> None:
         """Handle stop env hooks.
@@ -167,12 +395,13 @@ class LXDHarness(BaseHarness):
             instance (InstanceMetadata): Instance to run stop env hooks in.
         """
         stop_env_hooks = self._lxd_config.stopenv_hooks
-        while stop_env_hooks:
-            hook = stop_env_hooks.pop()
-            instance = self._client.instances.get(instance.name)
-            if hook.download is not None:
-                for artifact in hook.download:
-                    self._handle_artifact_download(instance, artifact)
+        if not stop_env_hooks:
+            return
+
+        handle = self._handle(instance)
+        for hook in reversed(stop_env_hooks):
+            if hook.download:
+                self._handle_artifact_download(handle, *hook.download)
 
     def _handle_package_install(self, instance: Any, pkg: BasePackage) -> None:
         """Install a package inside an LXD test environment instance.
@@ -184,43 +413,49 @@ class LXDHarness(BaseHarness):
         dispatch = {"charmlib": lambda x: self._env.add(json.loads(x))}
 
         dump_data = pkg._dumps()
-        instance.execute(["mkdir", "-p", "/root/init/pkg"])
-        instance.files.put("/root/init/pkg/install", dump_data["injectable"])
-        result = instance.execute(["python3", "/root/init/pkg/install"])
+        result = _push(
+            instance,
+            {"/root/init/pkg/install": dump_data["injectable"]},
+            then="python3 /root/init/pkg/install",
+        )
 
         if pkg.__class__.__name__.lower() in dispatch:
             dispatch[pkg.__class__.__name__.lower()](result.stdout)
 
-    def _handle_artifact_upload(self, instance: Any, artifact: Injectable) -> None:
-        """Upload an artifact to an LXD test environment instance.
+    def _handle_artifact_upload(self, instance: Any, *artifacts: Injectable) -> None:
+        """Upload artifacts to an LXD test environment instance.
+
+        Artifacts are loaded concurrently, then pushed and unpacked in a
+        single execution.
 
         Args:
-            instance (Any): Instance to upload artifact to.
-            artifact (Injectable): Artifact to upload.
+            instance (Any): Instance to upload artifacts to.
+            *artifacts (Injectable): Artifacts to upload.
         """
-        artifact.load()
-        dump_data = artifact._dumps(mode="push")
-        instance.execute(["mkdir", "-p", "/root/init/data"])
-        instance.files.put("/root/init/data/dump", dump_data["injectable"])
-        instance.execute(["python3", "/root/init/data/dump"])
+        with ThreadPoolExecutor(max_workers=thread_count()) as pool:
+            files = {
+                f"/root/init/data/dump_{i:04d}": injectable
+                for i, injectable in enumerate(pool.map(_load_artifact, artifacts))
+            }
+        _push(
+            instance,
+            files,
+            then="for f in /root/init/data/dump_*; do python3 $f || exit 1; rm -f $f; done",
+        )
+
+    def _handle_artifact_download(self, instance: Any, *artifacts: Injectable) -> None:
+        """Download artifacts from an LXD test environment instance.
 
-    def _handle_artifact_download(self, instance: Any, artifact: Injectable) -> None:
-        """Download an artifact from an LXD test environment instance.
+        All artifacts are collected with a single execution.
 
         Args:
-            instance (Any): Instance to download artifact from.
-            artifact (Injectable): Artifact to download.
+            instance (Any): Instance to download artifacts from.
+            *artifacts (Injectable): Artifacts to download.
+
+        Raises:
+            LXDHarnessError: Raised if an artifact fails to be collected.
         """
-        dump_data = artifact._dumps(mode="pull")
-        instance.execute(["mkdir", "-p", "/root/post/data"])
-        instance.files.put(
-            "/root/post/data/load",
-            dump_data["injectable"],
-        )
-        result = json.loads(
-            instance.execute(["python3", "/root/post/data/load"]).stdout
-        )
-        with tempfile.NamedTemporaryFile():
+        for artifact, result in zip(artifacts, _pull(instance, artifacts)):
             holder = artifact.__class__._loads(result["checksum"], result["data"])
             holder.dump()
 
@@ -246,7 +481,7 @@ class LXDProviderEntrypoint(BaseEntrypoint, LXDHarness):
             "parallel": self._parallel_entrypoint,
             "parallel_target": self._parallel_target_entrypoint,
         }
-        if strategy not in strategy_options.keys():
+        if strategy not in strategy_options:
             raise LXDEntrypointError(
                 (
                     f"{strategy} is not a valid strategy. "
@@ -254,9 +489,11 @@ class LXDProviderEntrypoint(BaseEntrypoint, LXDHarness):
                 )
             )
         setattr(self, "run", strategy_options[strategy])
-        [setattr(self, k, v) for k, v in kwargs.items()]
-        self._func = inspect.getsource(func)
-        self._func_name = func.__name__
+        self.__dict__.update(kwargs)
+        decorator = (
+            _LXD_TARGET_DECORATOR if strategy.endswith("_target") else _LXD_DECORATOR
+        )
+        self._testlet = self._make_testlet(_getsource(func), func.__name__, [decorator])
 
     def run(self) -> Iterable[Tuple[str, Result]]:
         """Method behavior is defined by passed strategy."""
@@ -278,10 +515,11 @@ class LXDProviderEntrypoint(BaseEntrypoint, LXDHarness):
             (Iterable[Tuple[str, Result]]):
                 Aggregated results of testlet runs from each instance.
         """
+        existing = self._existing_names()
         for instance in [
-            self._exists(InstanceMetadata(name=name)) for name in self._target_instances
+            self._exists(InstanceMetadata(name=name), existing)
+            for name in self._target_instances
         ]:
-            self._exists(instance)
             if not instance.exists:
                 raise LXDEntrypointError(f"Instance {instance.name} does not exist.")
             yield self._run_target(instance)
@@ -293,10 +531,10 @@ class LXDProviderEntrypoint(BaseEntrypoint, LXDHarness):
             (Iterable[Tuple[str, Result]]):
                 Aggregated results of testlet runs from each instance.
         """
-        with ProcessPoolExecutor(max_workers=self._num_threads) as pool:
-            results = pool.map(self._run, self._instance_metadata)
-            for result in results:
-                yield result
+        with ThreadPoolExecutor(max_workers=self._num_threads) as pool:
+            futures = [pool.submit(self._run, i) for i in self._instance_metadata]
+            for future in as_completed(futures):
+                yield future.result()
 
     def _parallel_target_entrypoint(self) -> Iterable[Tuple[str, Result]]:
         """Run testlets in parallel. LXD instances already exist.
@@ -305,16 +543,20 @@ class LXDProviderEntrypoint(BaseEntrypoint, LXDHarness):
             (Iterable[Tuple[str, Result]]):
                 Aggregated results of testlet runs from each instance.
         """
-        instance_metadata = [
-            self._exists(InstanceMetadata(name=name)) for name in self._target_instances
-        ]
-        for instance in instance_metadata:
-            if not instance.exists:
-                raise LXDEntrypointError(f"Instance {instance.name} does not exist.")
-        with ProcessPoolExecutor(max_workers=self._num_threads) as pool:
-            results = pool.map(self._run_target, instance_metadata)
-            for result in results:
-                yield result
+        with ThreadPoolExecutor(max_workers=self._num_threads) as pool:
+            existing = self._existing_names()
+            instance_metadata = [
+                self._exists(InstanceMetadata(name=name), existing)
+                for name in self._target_instances
+            ]
+            for instance in instance_metadata:
+                if not instance.exists:
+                    raise LXDEntrypointError(
+                        f"Instance {instance.name} does not exist."
+                    )
+            futures = [pool.submit(self._run_target, i) for i in instance_metadata]
+            for future in as_completed(futures):
+                yield future.result()
 
     def _run(self, instance: InstanceMetadata) -> Tuple[str, Result]:
         """Run testlet inside of test environment instance.
@@ -327,14 +569,9 @@ class LXDProviderEntrypoint(BaseEntrypoint, LXDHarness):
             (Tuple[str, Result]):
                 Result of test run inside LXD test environment instance.
         """
-        self._init(self._exists(instance))
+        self._init(instance)
         self._handle_start_env_hooks(instance)
-        result = self._execute(
-            self._make_testlet(
-                self._func, self._func_name, [re.compile(r"^@lxd\(([^)]+)\)")]
-            ),
-            instance,
-        )
+        result = self._execute(self._testlet, instance)
         self._handle_stop_env_hooks(instance)
         if self._preserve is False:
             self._teardown(instance)
@@ -354,11 +591,6 @@ class LXDProviderEntrypoint(BaseEntrypoint, LXDHarness):
                 LXD test environment instance.
         """
         self._handle_start_env_hooks(instance)
-        result = self._execute(
-            self._make_testlet(
-                self._func, self._func_name, [re.compile(r"^@lxd\.target\(([^)]+)\)")]
-            ),
-            instance,
-        )
+        result = self._execute(self._testlet, instance)
         self._handle_stop_env_hooks(instance)
         return instance.name, result
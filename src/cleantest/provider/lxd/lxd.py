@@ -13,6 +13,47 @@ from cleantest.meta.utils import thread_count
 
 from ._lxd_harness import LXDProviderEntrypoint
 
+_DEFAULT_IMAGES = ("ubuntu-jammy-amd64",)
+
+
+def _as_list(
+    value: Optional[Union[str, Iterable[str]]], default: Iterable[str] = ()
+) -> List[str]:
+    """Normalize a single name or collection of names into a list.
+
+    Args:
+        value (Optional[Union[str, Iterable[str]]]): Name or names to normalize.
+        default (Iterable[str]): Names to use if value is None (Default: ()).
+
+    Returns:
+        (List[str]): List of names.
+    """
+    if value is None:
+        return list(default)
+
+    return [value] if isinstance(value, str) else list(value)
+
+
+def _resolve_num_threads(num_threads: Optional[int], parallel: bool) -> Optional[int]:
+    """Determine the number of threads to run test environment instances with.
+
+    Args:
+        num_threads (Optional[int]): Number of threads requested by the user.
+        parallel (bool): Whether test environment instances run in parallel.
+
+    Returns:
+        (Optional[int]): Number of threads to use. Falls back to `thread_count()`
+            if the requested number is not a positive integer. None if
+            instances are not run in parallel.
+    """
+    if parallel is not True:
+        return None
+
+    if not isinstance(num_threads, int) or num_threads < 1:
+        return thread_count()
+
+    return num_threads
+
 
 class lxd:  # noqa N801
     """LXD test environment provider.
@@ -30,22 +71,19 @@ class lxd:  # noqa N801
     def __init__(
         self,
         name: str = "test",
-        image: Union[str, List[str]] = ["ubuntu-jammy-amd64"],
+        image: Optional[Union[str, List[str]]] = None,
         preserve: bool = True,
         parallel: bool = False,
         num_threads: Optional[int] = None,
     ) -> None:
         self._name = name
-        self._image = [image] if type(image) == str else image
+        self._image = _as_list(image, _DEFAULT_IMAGES)
         self._preserve = preserve
         self._env = Env()
         self._parallel = parallel
         self._lxd_config = Configure("lxd")
 
-        if (type(num_threads) != int or num_threads < 1) and self._parallel is True:
-            self._num_threads = thread_count()
-        elif type(num_threads) == int and self._parallel is True:
-            self._num_threads = num_threads
+        self._num_threads = _resolve_num_threads(num_threads, parallel)
 
     def __call__(self, func: Callable) -> Callable:
         """Callable for lxd decorator."""
@@ -86,17 +124,11 @@ class lxd:  # noqa N801
         def decorator(func: Callable) -> Callable:
             @functools.wraps(func)
             def wrapper(*args, **kwargs) -> Iterable[Tuple[str, Result]]:
-                if (type(num_threads) != int or num_threads < 1) and parallel is True:
-                    _num_threads = num_threads
-                elif type(num_threads) == int and parallel is True:
-                    _num_threads = num_threads
-                else:
-                    _num_threads = None
                 _ = {
                     "_target_instances": [*instances],
                     "_env": Env(),
                     "_lxd_config": Configure("lxd"),
-                    "_num_threads": _num_threads,
+                    "_num_threads": _resolve_num_threads(num_threads, parallel),
                 }
                 handler = (
                     LXDProviderEntrypoint(strategy="parallel_target", func=func, **_)
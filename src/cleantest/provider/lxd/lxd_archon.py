@@ -4,35 +4,36 @@
 
 """Direct the LXD test environment provider and instances."""
 
-import csv
-import json
+import atexit
+import functools
 import logging
 import os
 import pathlib
 import shlex
 import shutil
 from collections import namedtuple
-from concurrent.futures import ProcessPoolExecutor
-from io import StringIO
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from ipaddress import IPv4Address, IPv6Address
-from typing import Dict, List, Optional, Tuple, Union
-
-from pylxd import Client
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from cleantest.control.lxd._lxd_configurer import LXDConfigurer
 from cleantest.data import Dir, File
 from cleantest.meta import Result
 from cleantest.meta._cleantest_info import CleantestInfo
 from cleantest.meta.utils import thread_count
-from cleantest.utils import run
+
+from ._lxd_harness import LXDHarnessError, _load_artifact, _pull, _push
+
+if TYPE_CHECKING:
+    from pylxd import Client
 
 logger = logging.getLogger(__name__)
 
 # Metaclass to encapsulate work information sent to _add threads.
 _AddWorkOrder = namedtuple(
     "_AddWorkOrder",
-    ["name", "image", "provision_script", "resources"],
-    defaults=[None, None, None, None],
+    ["name", "image", "provision_script", "resources", "installers"],
+    defaults=[None, None, None, None, None],
 )
 
 # Metaclass to encapsulate work information sent to _execute threads.
@@ -43,6 +44,22 @@ _ExecuteWorkOrder = namedtuple(
 )
 
 
+@functools.lru_cache(maxsize=1)
+def _cleantest_installers() -> Dict[str, str]:
+    """Generate the injectables that install cleantest inside new instances.
+
+    The injectables are identical for every instance, so they are generated
+    once and shared by every call to `LXDArchon.add`.
+
+    Returns:
+        (Dict[str, str]): Absolute paths and contents of the injectables.
+    """
+    return {
+        f"/root/.init/cleantest/install_{name}": data["injectable"]
+        for name, data in CleantestInfo().dumps()
+    }
+
+
 class LXDArchonError(Exception):
     """Raise when LXDArchon encounters an error."""
 
@@ -51,6 +68,8 @@ class LXDArchon:
     """Direct the LXD test environment provider via the LXD API socket."""
 
     __instances = set()
+    __connection = None
+    __executor = None
 
     def __new__(cls) -> "LXDArchon":
         """Create new LXDArchon instance.
@@ -63,13 +82,50 @@ class LXDArchon:
         return cls.__instance
 
     @property
-    def __client(self) -> Client:
+    def __client(self) -> "Client":
         """Establish connection to LXD API socket.
 
+        The connection is opened on first access and reused until the
+        client configuration changes.
+
         Returns:
             (Client): Connection to LXD API socket.
         """
-        return Client(**self.config.client_config.dict())
+        client_config = self.config.client_config
+        if (
+            LXDArchon.__connection is None
+            or LXDArchon.__connection[0] is not client_config
+        ):
+            from pylxd import Client
+
+            LXDArchon.__connection = (client_config, Client(**client_config.dict()))
+
+        return LXDArchon.__connection[1]
+
+    @property
+    def __pool(self) -> ThreadPoolExecutor:
+        """Get the worker pool shared by LXDArchon operations.
+
+        The pool is created on first use, kept warm across calls, and shut
+        down when the interpreter exits.
+
+        Returns:
+            (ThreadPoolExecutor): Worker pool.
+        """
+        if LXDArchon.__executor is None:
+            LXDArchon.__executor = ThreadPoolExecutor(max_workers=thread_count())
+
+        return LXDArchon.__executor
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Shut down the worker pool shared by LXDArchon operations.
+
+        A new pool is created if LXDArchon is used again afterwards.
+        """
+        if cls.__executor is not None:
+            cls.__executor.shutdown(wait=True)
+            cls.__executor = None
 
     @property
     def config(self) -> LXDConfigurer:
@@ -91,6 +147,28 @@ class LXDArchon:
         """
         return self.__client.instances.exists(target)
 
+    def __get(self, target: str, action: str) -> Any:
+        """Get a test environment instance, checking existence in the same request.
+
+        Args:
+            target (str): Instance to get.
+            action (str): Action being performed on the instance. Used in errors.
+
+        Raises:
+            LXDArchonError: Raised if the instance does not exist.
+
+        Returns:
+            (Any): pylxd object of the instance.
+        """
+        from pylxd.exceptions import NotFound
+
+        try:
+            return self.__client.instances.get(target)
+        except NotFound:
+            raise LXDArchonError(
+                f"Instance {target} does not exist. Cannot {action} object."
+            ) from None
+
     def add(
         self,
         name: Union[str, List[str]],
@@ -112,17 +190,21 @@ class LXDArchon:
                 new instance starts. You should only upload resources that are
                 required for provisioning the test environment instance.
         """
-        names = [name] if type(name) == str else name
+        names = [name] if isinstance(name, str) else name
         resources = resources if resources is not None else []
-        with ProcessPoolExecutor(max_workers=thread_count()) as pool:
-            for result in pool.map(
+        # Build the installers while LXD creates and starts the instances. The
+        # build is submitted first so that no _add task can wait on it from
+        # ahead of it in the pool's queue.
+        installers = self.__pool.submit(_cleantest_installers)
+        futures = [
+            self.__pool.submit(
                 self._add,
-                (
-                    _AddWorkOrder(name, image, provision_script, resources)
-                    for name in names
-                ),
-            ):
-                self.__instances.add(result)
+                _AddWorkOrder(name, image, provision_script, resources, installers),
+            )
+            for name in names
+        ]
+        for future in as_completed(futures):
+            self.__instances.add(future.result())
 
     def _add(self, work_order: _AddWorkOrder) -> str:
         """Sub-function for setting up new test environment instance.
@@ -140,19 +222,18 @@ class LXDArchon:
         instance.start(wait=True)
 
         logger.info("Before injection")
-        instance.execute(shlex.split("mkdir -p /root/.init/cleantest"))
-        for name, data in CleantestInfo().dumps():
-            instance.files.put(
-                f"/root/.init/cleantest/install_{name}",
-                data["injectable"],
-            )
-            instance.execute(
-                shlex.split(f"python3 /root/.init/cleantest/install_{name}")
-            )
+        _push(
+            instance,
+            work_order.installers.result(),
+            then="for f in /root/.init/cleantest/install_*; do python3 $f || exit 1; done",
+        )
         logger.info("After injection")
-        for resource in work_order.resources:
+        if work_order.resources:
             self.push(
-                work_order.name, data_obj=resource, username="root", groupname="root"
+                work_order.name,
+                data_obj=work_order.resources,
+                username="root",
+                groupname="root",
             )
 
         if work_order.provision_script is not None:
@@ -161,7 +242,7 @@ class LXDArchon:
                 work_order.name,
                 data_obj=[File(work_order.provision_script, "/root/.init/provision")],
             )
-            instance.execute(shlex.split("python3 /root/.init/provision"))
+            instance.execute(["python3", "/root/.init/provision"])
 
         return work_order.name
 
@@ -175,15 +256,15 @@ class LXDArchon:
                 Command to execute.
         """
         _ = {}
-        targets = [target] if type(target) == str else target
-        [self.exists(target) for target in targets]
-        with ProcessPoolExecutor(max_workers=thread_count()) as pool:
-            for name, result in pool.map(
-                self._execute,
-                (_ExecuteWorkOrder(target, command) for target in targets),
-            ):
-                assert result.exit_code == 0
-                _.update({name: result})
+        targets = [target] if isinstance(target, str) else target
+        futures = [
+            self.__pool.submit(self._execute, _ExecuteWorkOrder(target, command))
+            for target in targets
+        ]
+        for future in as_completed(futures):
+            name, result = future.result()
+            assert result.exit_code == 0
+            _[name] = result
 
         return _
 
@@ -250,10 +331,7 @@ class LXDArchon:
             else []
         )
 
-        if not self.exists(target):
-            raise LXDArchonError(
-                f"Instance {target} does not exist. Cannot pull object."
-            )
+        instance = self.__get(target, "pull")
         if src is None and dest is None and data_obj is None:
             raise LXDArchonError(f"Nothing to pull from {target}.")
         if (src is not None and dest is None) or (src is None and dest is not None):
@@ -265,45 +343,44 @@ class LXDArchon:
         if gid is not None and groupname is not None:
             raise LXDArchonError("Please specify only gid or groupname, not both.")
 
-        instance = self.__client.instances.get(target)
-        instance.execute(shlex.split("mkdir -p /root/.pull"))
-
         if src is not None and dest is not None:
-            if instance.execute(shlex.split(f"test -f  {src}")).exit_code == 0:
+            if instance.execute(["test", "-f", str(src)]).exit_code == 0:
                 _ = File(src, dest, overwrite=overwrite)
-            elif instance.execute(shlex.split(f"test -d {src}")).exit_code == 0:
+            elif instance.execute(["test", "-d", str(src)]).exit_code == 0:
                 _ = Dir(src, dest, overwrite=overwrite)
             else:
                 raise LXDArchonError(f"{src} is not a file or directory.")
 
             _objects.append(_)
 
-        for _ in _objects:
-            instance.files.put("/root/.pull/load", _._dumps(mode="pull")["injectable"])
-            result = json.loads(
-                instance.execute(shlex.split("python3 /root/.pull/load")).stdout
-            )
+        try:
+            results = _pull(instance, _objects)
+        except LXDHarnessError as e:
+            raise LXDArchonError(str(e)) from e
+
+        user = uid if uid is not None else username
+        group = gid if gid is not None else groupname
+        for _, result in zip(_objects, results):
             placeholder = _.__class__._loads(result["checksum"], result["data"])
             placeholder.dump()
-            if (
-                uid is not None
-                or username is not None
-                or gid is not None
-                or groupname is not None
-            ):
-                if placeholder.dest.is_dir():
-                    for d in placeholder.dest.iterdir():
-                        shutil.chown(d, user=uid or username, group=gid or groupname)
-                else:
-                    shutil.chown(
-                        placeholder.dest, user=uid or username, group=gid or groupname
-                    )
-            if mode is not None:
-                if placeholder.dest.is_dir():
-                    for d in placeholder.dest.iterdir():
-                        d.chmod(mode)
-                else:
-                    placeholder.chmod(mode)
+            if user is None and group is None and mode is None:
+                continue
+
+            dest = pathlib.Path(placeholder.dest)
+            paths = (
+                (
+                    pathlib.Path(root, name)
+                    for root, dirs, files in os.walk(dest)
+                    for name in dirs + files
+                )
+                if dest.is_dir()
+                else (dest,)
+            )
+            for path in paths:
+                if user is not None or group is not None:
+                    shutil.chown(path, user=user, group=group)
+                if mode is not None:
+                    path.chmod(mode)
 
     def push(  # noqa C901
         self,
@@ -359,10 +436,7 @@ class LXDArchon:
             else []
         )
 
-        if not self.exists(target):
-            raise LXDArchonError(
-                f"Instance {target} does not exist. Cannot push object."
-            )
+        instance = self.__get(target, "push")
         if src is None and dest is None and data_obj is None:
             raise LXDArchonError(f"Nothing to push to {target}.")
         if (src is not None and dest is None) or (src is None and dest is not None):
@@ -374,8 +448,6 @@ class LXDArchon:
         if gid is not None and groupname is not None:
             raise LXDArchonError("Please specify only gid or groupname, not both.")
 
-        instance = self.__client.instances.get(target)
-        instance.execute(shlex.split("mkdir -p /root/.push"))
         if src is not None and dest is not None:
             if pathlib.Path(src).is_file():
                 _ = File(src, dest, overwrite=overwrite)
@@ -386,31 +458,45 @@ class LXDArchon:
 
             _objects.append(_)
 
-        for _ in _objects:
-            _.load()
-            instance.files.put("/root/.push/dump", _._dumps(mode="push")["injectable"])
-            instance.execute(shlex.split("python3 /root/.push/dump"))
-            if (
-                uid is not None
-                or username is not None
-                or gid is not None
-                or groupname is not None
-            ):
-                instance.execute(
-                    shlex.split(
-                        f"chown -R {uid or username}:{gid or groupname} {str(_.dest)}"
-                    )
-                )
-            if mode is not None:
-                instance.execute(shlex.split(f"chmod -R {mode} {str(_.dest)}"))
+        with ThreadPoolExecutor(max_workers=thread_count()) as pool:
+            files = {
+                f"/root/.push/dump_{i:04d}": injectable
+                for i, injectable in enumerate(pool.map(_load_artifact, _objects))
+            }
+        commands = [
+            "for f in /root/.push/dump_*; do python3 $f || exit 1; rm -f $f; done"
+        ]
+        dests = " ".join(shlex.quote(str(_.dest)) for _ in _objects)
+        user = uid if uid is not None else username
+        group = gid if gid is not None else groupname
+        if user is not None or group is not None:
+            owner = ":".join(str(i) for i in (user, group) if i is not None)
+            if user is None:
+                owner = f":{owner}"
+            commands.append(f"chown -R {shlex.quote(owner)} {dests}")
+        if mode is not None:
+            commands.append(
+                f"chmod -R {mode if isinstance(mode, str) else format(mode, 'o')} {dests}"
+            )
+        try:
+            _push(instance, files, then=" && ".join(commands))
+        except LXDHarnessError as e:
+            raise LXDArchonError(str(e)) from e
 
     def destroy(self) -> None:
         """Destroy all test environment instances in LXD cluster."""
         logger.info(f"Destroying instances {self.__instances}")
-        for i in self.__instances:
-            instance = self.__client.instances.get(i)
-            instance.stop(wait=True)
-            instance.delete(wait=True)
+        list(self.__pool.map(self._destroy, self.__instances))
+
+    def _destroy(self, target: str) -> None:
+        """Sub-function for destroying a test environment instance.
+
+        Args:
+            target (str): Name of test environment instance to destroy.
+        """
+        instance = self.__client.instances.get(target)
+        instance.stop(wait=True)
+        instance.delete(wait=True)
 
     def get_public_address(
         self, target: str, ipv6: bool = False
@@ -427,9 +513,16 @@ class LXDArchon:
                 Public address of test environment instance.
                 None if the instance does not have a public address.
         """
-        _ = csv.reader(StringIO(next(run("lxc list -c n46 -f csv")).stdout))
-        for row in _:
-            if row[0] == target and ipv6:
-                return IPv6Address(row[2].split(" ")[0]) if row[2] != "" else None
-            elif row[0] == target:
-                return IPv4Address(row[1].split(" ")[0]) if row[1] != "" else None
+        family, address_cls = ("inet6", IPv6Address) if ipv6 else ("inet", IPv4Address)
+        network = self.__client.instances.get(target).state().network or {}
+        for name, interface in network.items():
+            if name == "lo":
+                continue
+            for address in interface.get("addresses", []):
+                if address["family"] == family and address["scope"] == "global":
+                    return address_cls(address["address"])
+
+        return None
+
+
+atexit.register(LXDArchon.shutdown)
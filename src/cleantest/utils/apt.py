@@ -13,6 +13,29 @@ import subprocess
 from enum import Enum
 from typing import Dict, Optional, Union
 
+# Parsers for `apt-cache policy`, `dpkg -l`, and package version strings.
+_POLICY_MATCHER = re.compile(
+    r"""
+        (?P<priority>\d+?)\s+
+        (?P<uri>.*?)\s+
+        (?P<channel>.*?)\s+
+        (?P<arch>\w+?)\s+
+        (?P<content>.*)
+    """,
+    re.VERBOSE,
+)
+_DPKG_MATCHER = re.compile(
+    r"""
+        ^(?P<status>\w+?)\s+
+        (?P<name>.*?)(?P<throwaway>:\w+?)?\s+
+        (?P<version>.*?)\s+
+        (?P<arch>\w+?)\s+
+        (?P<description>.*)
+    """,
+    re.VERBOSE,
+)
+_VERSION_MATCHER = re.compile(r"(?:(.*):)?(.*)-(.*)")
+
 
 class Error(Exception):
     """Raised when apt encounters an execution error."""
@@ -165,44 +188,21 @@ def fetch(package: str) -> PackageInfo:
         (PackageInfo): Information about package.
     """
     try:
-        # Compile regexes
-        policy_matcher = re.compile(
-            r"""
-                (?P<priority>\d+?)\s+
-                (?P<uri>.*?)\s+
-                (?P<channel>.*?)\s+
-                (?P<arch>\w+?)\s+
-                (?P<content>.*)
-            """,
-            re.VERBOSE,
-        )
-        dpkg_matcher = re.compile(
-            r"""
-                ^(?P<status>\w+?)\s+
-                (?P<name>.*?)(?P<throwaway>:\w+?)?\s+
-                (?P<version>.*?)\s+
-                (?P<arch>\w+?)\s+
-                (?P<description>.*)
-            """,
-            re.VERBOSE,
-        )
-        version_matcher = re.compile(r"(?:(.*):)?(.*)-(.*)")
-
         # If policy parse passes, check if package is installed. Otherwise, absent.
         policy = _apt_cache("policy", package).splitlines()[5]
-        policy_matches = policy_matcher.search(policy).groupdict()
+        policy_matches = _POLICY_MATCHER.search(policy).groupdict()
         try:
             # Check if package is installed. If error, get info from `apt-cache show`.
             info = _dpkg("-l", package).splitlines()[5:]
             for line in info:
-                dpkg_matches = dpkg_matcher.search(line).groupdict()
+                dpkg_matches = _DPKG_MATCHER.search(line).groupdict()
                 if not dpkg_matches["status"].endswith("i"):
                     # Packages not installed. Move to `apt-cache show ...`
                     raise Error(
                         f"{package} in `dpkg -l {package}` output but not installed."
                     )
 
-                epoch, version, release = version_matcher.match(
+                epoch, version, release = _VERSION_MATCHER.match(
                     dpkg_matches["version"]
                 ).groups()
                 return PackageInfo(
@@ -226,7 +226,7 @@ def fetch(package: str) -> PackageInfo:
             for line in info:
                 if line.startswith(("Architecture", "Version")):
                     tmp = line.split(":", 1)
-                    pkg_data.update({tmp[0].lower(): tmp[1].strip()})
+                    pkg_data[tmp[0].lower()] = tmp[1].strip()
                 # Check if we have bot version and architecture present. If so, break.
                 if (
                     pkg_data.get("architecture", None) is not None
@@ -234,7 +234,7 @@ def fetch(package: str) -> PackageInfo:
                 ):
                     break
 
-            epoch, version, release = version_matcher.match(
+            epoch, version, release = _VERSION_MATCHER.match(
                 pkg_data["version"]
             ).groups()
             return PackageInfo(
@@ -274,7 +274,7 @@ def _apt(*args: str) -> str:
 
     try:
         return subprocess.run(
-            ["apt-get", "-y", *args],
+            ["apt-get", "-y", "-o", "Dpkg::Use-Pty=0", *args],
             env={"DEBIAN_FRONTEND": "noninteractive", "PATH": os.getenv("PATH")},
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
@@ -11,6 +11,9 @@ import subprocess
 from enum import Enum
 from typing import Dict, Optional, Union
 
+# Parser for package version strings.
+_VERSION_MATCHER = re.compile(r"(?:(.*):)?(.*)-(.*)")
+
 
 class Error(Exception):
     """Raise when dnf encounters an execution error."""
@@ -162,7 +165,7 @@ def fetch(package: str) -> PackageInfo:
         ]  # Only take top two lines.
         pkg_name, pkg_version, pkg_repo = info.split()
         name, arch = pkg_name.rsplit(".", 1)
-        epoch, version, release = re.match(r"(?:(.*):)?(.*)-(.*)", pkg_version).groups()
+        epoch, version, release = _VERSION_MATCHER.match(pkg_version).groups()
         if "Installed" in status:
             state = _PackageState.INSTALLED
         elif "Available" in status:
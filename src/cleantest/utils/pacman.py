@@ -13,6 +13,20 @@ import subprocess
 from enum import Enum
 from typing import Dict, Optional, Union
 
+# Parsers for `pacman --version` output and package version strings.
+_VERSION_MATCHER = re.compile(
+    r"""
+        (?P<throwaway>.*?)\s+
+        (?P<frontend>.*?)\s+
+        (?P<frontend_version>.*?)\s+
+        (?P<spacer>-)\s+
+        (?P<backend>.*?)\s+
+        (?P<backend_version>.*)
+    """,
+    re.VERBOSE,
+)
+_RELEASE_MATCHER = re.compile(r"(.*)-(.*)")
+
 
 class Error(Exception):
     """Raised when pacman encounters an execution error."""
@@ -81,18 +95,7 @@ class PackageInfo:
 
 def version() -> str:
     """Get version of `pacman` executable."""
-    version_matcher = re.compile(
-        r"""
-            (?P<throwaway>.*?)\s+
-            (?P<frontend>.*?)\s+
-            (?P<frontend_version>.*?)\s+
-            (?P<spacer>-)\s+
-            (?P<backend>.*?)\s+
-            (?P<backend_version>.*)
-        """,
-        re.VERBOSE,
-    )
-    matches = version_matcher.search(
+    matches = _VERSION_MATCHER.search(
         _pacman("--version").splitlines()[0].strip()
     ).groupdict()
     return matches["frontend_version"][1:]
@@ -172,9 +175,9 @@ def fetch(package: str) -> PackageInfo:
         for line in info:
             if line.startswith(("Architecture", "Repository", "Version")):
                 tmp = line.split(":", 1)
-                pkg_data.update({tmp[0].strip().lower(): tmp[1].strip()})
+                pkg_data[tmp[0].strip().lower()] = tmp[1].strip()
 
-        version, release = re.match(r"(.*)-(.*)", pkg_data["version"]).groups()
+        version, release = _RELEASE_MATCHER.match(pkg_data["version"]).groups()
         try:
             _pacman("-Qs", package)
             state = _PackageState.INSTALLED
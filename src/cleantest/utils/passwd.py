@@ -28,7 +28,7 @@ class User:
     """
 
     def __init__(self, user: Union[str, "User"]) -> None:
-        if type(user) != str and type(user) != type(self):
+        if not isinstance(user, (str, type(self))):
             raise TypeError(
                 f"Argument `user` should be type str or User, not {type(user)}."
             )
@@ -167,7 +167,7 @@ class Group:
     """
 
     def __init__(self, group: Union[str, "Group"]) -> None:
-        if type(group) != str and type(group) != type(self):
+        if not isinstance(group, (str, type(self))):
             raise TypeError(
                 f"Argument `group` should be type str or Group, not {type(group)}."
             )
@@ -18,7 +18,7 @@ from collections.abc import Mapping
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from subprocess import CalledProcessError, CompletedProcess
-from typing import Any, Callable, Dict, Iterable, List, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 # Filter for extracting 7-bit C1 ANSI sequences from a string.
 ansi_filter = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
@@ -595,8 +595,8 @@ class SnapClient:
             data = json.dumps(body).encode("utf-8")
             headers["Content-Type"] = "application/json"
 
-        response = self._request_raw(method, path, query, headers, data)
-        return json.loads(response.read().decode())["result"]
+        with self._request_raw(method, path, query, headers, data) as response:
+            return json.load(response)["result"]
 
     def _request_raw(
         self,
@@ -873,7 +873,8 @@ def install_local(
     classic: bool = False,
     devmode: bool = False,
     dangerous: bool = False,
-) -> Snap:
+    wait: bool = True,
+) -> Union[Snap, str]:
     """Install snap package using local .snap file.
 
     Args:
@@ -884,9 +885,16 @@ def install_local(
             install snap without a signature (Default: False).
         devmode (bool): Whether --devmode should be passed to
             install snap with devmode confinement (Default: False).
+        wait (bool):
+            True - wait for install operation to finish.
+            False - do not wait for install operation to finish (Default: True).
 
     Raises:
         SnapHandlerError: Raised if local .snap package fails to install.
+
+    Returns:
+        (Union[Snap, str]): Installed snap if waiting for install operation to
+            finish, otherwise ID of the change performing the install operation.
     """
     _cmd = [
         "snap",
@@ -899,8 +907,13 @@ def install_local(
         _cmd.append("--devmode")
     if dangerous:
         _cmd.append("--dangerous")
+    if not wait:
+        _cmd.append("--no-wait")
     try:
         result = subprocess.check_output(_cmd, universal_newlines=True).splitlines()[-1]
+        if not wait:
+            return result.strip()
+
         snap_name, _ = result.split(" ", 1)
         snap_name = ansi_filter.sub("", snap_name)
 
@@ -911,7 +924,7 @@ def install_local(
         raise SnapHandlerError(f"Could not install snap {filename}: {e.output}")
 
 
-def alias(alias_snap: str, app: str, alias: str, wait: bool = True) -> None:
+def alias(alias_snap: str, app: str, alias: str, wait: bool = True) -> Optional[str]:
     """Add an alias for a snap command.
 
     Args:
@@ -924,13 +937,18 @@ def alias(alias_snap: str, app: str, alias: str, wait: bool = True) -> None:
 
     Raises:
         SnapHandlerError: Raised if alias operation fails.
+
+    Returns:
+        (Optional[str]): ID of the change performing the alias operation
+            if not waiting for the operation to finish.
     """
     _cmd = ["snap", "alias", f"{alias_snap}.{app}", alias]
     if not wait:
         _cmd.append("--no-wait")
 
     try:
-        subprocess.check_output(_cmd, universal_newlines=True)
+        result = subprocess.check_output(_cmd, universal_newlines=True)
+        return None if wait else result.strip()
     except subprocess.CalledProcessError:
         raise SnapHandlerError(
             f"Failed to create alias. Command used: {' '.join(_cmd)}"
@@ -967,7 +985,7 @@ def connect(
     slot_snap: str = None,
     slot: str = None,
     wait: bool = True,
-) -> None:
+) -> Optional[str]:
     """Connect a snap plug to a slot.
 
     Args:
@@ -981,6 +999,10 @@ def connect(
 
     Raises:
         SnapHandlerError: Raised if connect operation fails.
+
+    Returns:
+        (Optional[str]): ID of the change performing the connect operation
+            if not waiting for the operation to finish.
     """
     _cmd = ["snap", "connect", f"{plug_snap}:{plug}"]
     if slot_snap is not None and slot is not None:
@@ -993,7 +1015,8 @@ def connect(
         _cmd.append("--no-wait")
 
     try:
-        subprocess.check_output(_cmd, universal_newlines=True)
+        result = subprocess.check_output(_cmd, universal_newlines=True)
+        return None if wait else result.strip()
     except subprocess.CalledProcessError:
         raise SnapHandlerError(f"Failed to connect. Command used: {' '.join(_cmd)}")
 
@@ -1041,6 +1064,22 @@ def disconnect(
         )
 
 
+def watch(change_id: str) -> None:
+    """Wait for a snapd change to finish.
+
+    Args:
+        change_id (str): ID of change to wait for.
+
+    Raises:
+        SnapHandlerError: Raised if change fails.
+    """
+    _cmd = ["snap", "watch", change_id]
+    try:
+        subprocess.check_output(_cmd, universal_newlines=True)
+    except subprocess.CalledProcessError as e:
+        raise SnapHandlerError(f"Change {change_id} failed: {e.output}")
+
+
 def _system_set(config_item: str, value: str) -> None:
     """Helper for setting snap system config values.
 
@@ -1070,7 +1109,7 @@ def hold_refresh(days: int = 90) -> None:
     Warnings:
         This method does not currently support snap's experimental `--hold` feature.
     """
-    if not type(days) == int or days > 90:
+    if not isinstance(days, int) or days > 90:
         raise ValueError(f"Days must be an int between 1 and 90. Not {days}.")
     elif days == 0:
         _system_set("refresh.hold", "")
@@ -47,7 +47,11 @@ def _systemctl(
     """
     _check_systemd_available()
     services = (
-        [] if services is None else [services] if services == type(str) else services
+        []
+        if services is None
+        else [services]
+        if isinstance(services, str)
+        else services
     )
     optargs = optargs if optargs is not None else []
     _cmd = ["systemctl", command, *optargs, *services]